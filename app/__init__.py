@@ -10,10 +10,13 @@ Architecture:
     - presentation/    Web layer (Flask routes)
 """
 
-from pathlib import Path
+import sys
+import threading
 
 from flask import Flask
 
+from app.paths import STATIC_DIR, TEMPLATES_DIR
+
 
 def create_app() -> Flask:
     """
@@ -29,15 +32,47 @@ def create_app() -> Flask:
     # Create Flask app
     app = Flask(
         __name__,
-        template_folder=str(Path(__file__).parent / "templates"),
-        static_folder=str(Path(__file__).parent.parent / "static"),
+        template_folder=str(TEMPLATES_DIR),
+        static_folder=str(STATIC_DIR),
     )
 
     app.config["SECRET_KEY"] = "invoice-generator-secret"
 
+    # In packaged builds, prefer the templates pre-compiled by build_app.py;
+    # ModuleLoader loads the baked bytecode, so the first render skips
+    # Jinja's source parse and compile. Only consulted when running frozen:
+    # a dev server must always render from source, or a leftover archive
+    # from a local build would silently shadow template edits. The wrap has
+    # to happen on the environment's loader (not app.jinja_loader) because
+    # ModuleLoader only supports load(), not get_source(), and Flask's
+    # dispatching loader would call the latter. The source loader stays as
+    # a fallback for templates missing from the archive.
+    compiled_templates = TEMPLATES_DIR.parent / "templates_compiled.zip"
+    if hasattr(sys, "_MEIPASS") and compiled_templates.is_file():
+        from jinja2 import ChoiceLoader, ModuleLoader
+
+        app.jinja_env.loader = ChoiceLoader(
+            [ModuleLoader(str(compiled_templates)), app.jinja_env.loader]
+        )
+
+    # Skip the per-response key sort and pretty-printing whitespace when
+    # serializing JSON; the invoice/leave list endpoints emit hundreds of
+    # dicts and the frontend never relies on key order
+    app.json.sort_keys = False
+    app.json.compact = True
+
     # Register routes
     from app.presentation.routes import register_routes
 
     register_routes(app)
 
+    # Probe PDF converter availability off the startup path so the first
+    # invoice doesn't pay for executable discovery
+    container = get_container()
+    threading.Thread(
+        target=container.pdf_converter.get_available_strategies,
+        name="pdf-warmup",
+        daemon=True,
+    ).start()
+
     return app
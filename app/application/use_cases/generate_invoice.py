@@ -1,8 +1,10 @@
 """Generate Invoice Use Case"""
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from app.core.entities.invoice import Invoice, InvoiceInput
 from app.core.interfaces.document_generator import DocumentGenerator
@@ -11,6 +13,9 @@ from app.core.interfaces.pdf_converter import PDFConverter
 from app.core.interfaces.settings_repository import SettingsRepository
 from app.core.services.invoice_calculator import InvoiceCalculator
 
+# Shared fallback so default-wired use cases reuse a single calculator
+_DEFAULT_CALCULATOR = InvoiceCalculator()
+
 
 @dataclass
 class GenerateInvoiceRequest:
@@ -34,12 +39,24 @@ class GenerateInvoiceResponse:
 
     success: bool
     invoice: Optional[Invoice] = None
+    invoice_id: Optional[int] = None
     docx_filename: Optional[str] = None
     pdf_filename: Optional[str] = None
+    pdf_pending: bool = False
     pdf_error: Optional[str] = None
     error: Optional[str] = None
 
 
+@dataclass
+class PdfStatusResponse:
+    """Status of a background PDF conversion"""
+
+    success: bool
+    ready: bool = False
+    pdf_filename: Optional[str] = None
+    error: Optional[str] = None
+
+
 class GenerateInvoiceUseCase:
     """
     Use case for generating invoices.
@@ -59,12 +76,18 @@ class GenerateInvoiceUseCase:
         document_generator: DocumentGenerator,
         pdf_converter: PDFConverter,
         invoice_calculator: InvoiceCalculator = None,
+        pdf_executor: Optional[Executor] = None,
     ):
         self._invoices = invoice_repository
         self._settings = settings_repository
         self._doc_generator = document_generator
         self._pdf_converter = pdf_converter
-        self._calculator = invoice_calculator or InvoiceCalculator()
+        self._calculator = invoice_calculator or _DEFAULT_CALCULATOR
+        # When an executor is provided, PDF conversion (the LibreOffice long
+        # pole) runs in the background and the response returns after the
+        # DOCX is written; clients poll get_pdf_status() for the result.
+        self._pdf_executor = pdf_executor
+        self._pdf_errors: Dict[int, str] = {}
 
     def execute(self, request: GenerateInvoiceRequest) -> GenerateInvoiceResponse:
         """Execute the use case"""
@@ -99,9 +122,13 @@ class GenerateInvoiceUseCase:
             docx_path = None
             pdf_path = None
             pdf_error = None
+            pdf_pending = False
             pdf_path_str = None
             docx_path_str = None
 
+            # Delete the intermediate DOCX once the PDF exists?
+            delete_docx = output_format == "pdf"
+
             # DOCX is always generated first (PDF needs it as source)
             if generate_docx or generate_pdf:
                 docx_path = self._doc_generator.generate(invoice, settings)
@@ -109,26 +136,30 @@ class GenerateInvoiceUseCase:
 
             # Convert to PDF if requested
             if generate_pdf and docx_path:
-                try:
-                    pdf_path = self._pdf_converter.convert(docx_path)
-                    if pdf_path and pdf_path.exists():
-                        pdf_path_str = str(pdf_path.absolute())
-                    else:
-                        pdf_error = "PDF file was not created"
-                except Exception as e:
-                    pdf_error = str(e)
-
-                # If only PDF was requested, delete the DOCX
-                if output_format == "pdf" and pdf_path and pdf_path.exists():
+                if self._pdf_executor is not None:
+                    # Background mode: respond now, convert after
+                    pdf_pending = True
+                else:
                     try:
-                        docx_path.unlink()  # Delete the DOCX
-                        docx_path_str = None
-                        docx_path = None
-                    except:
-                        pass  # Keep DOCX if deletion fails
+                        pdf_path = self._pdf_converter.convert(docx_path)
+                        if pdf_path and pdf_path.exists():
+                            pdf_path_str = str(pdf_path.absolute())
+                        else:
+                            pdf_error = "PDF file was not created"
+                    except Exception as e:
+                        pdf_error = str(e)
+
+                    # If only PDF was requested, delete the DOCX
+                    if delete_docx and pdf_path and pdf_path.exists():
+                        try:
+                            docx_path.unlink()  # Delete the DOCX
+                            docx_path_str = None
+                            docx_path = None
+                        except:
+                            pass  # Keep DOCX if deletion fails
 
             # Save to repository
-            self._invoices.save(
+            record = self._invoices.save(
                 invoice_number=invoice.invoice_number,
                 invoice_date=invoice.invoice_date,
                 service_period_start=invoice.service_period_start,
@@ -139,13 +170,63 @@ class GenerateInvoiceUseCase:
                 pdf_path=pdf_path_str,
             )
 
+            if pdf_pending:
+                self._pdf_errors.pop(record.id, None)
+                self._pdf_executor.submit(
+                    self._convert_pdf_background, record.id, docx_path, docx_path_str, delete_docx
+                )
+
+            # In background PDF-only mode the DOCX is transient; don't advertise it
+            show_docx = docx_path is not None and not (pdf_pending and delete_docx)
+
             return GenerateInvoiceResponse(
                 success=True,
                 invoice=invoice,
-                docx_filename=docx_path.name if docx_path else None,
+                invoice_id=record.id,
+                docx_filename=docx_path.name if show_docx else None,
                 pdf_filename=pdf_path.name if pdf_path else None,
+                pdf_pending=pdf_pending,
                 pdf_error=pdf_error,
             )
 
         except Exception as e:
             return GenerateInvoiceResponse(success=False, error=str(e))
+
+    def _convert_pdf_background(
+        self, record_id: int, docx_path: Path, docx_path_str: str, delete_docx: bool
+    ) -> None:
+        """Convert to PDF on the worker thread and update the stored record"""
+        try:
+            pdf_path = self._pdf_converter.convert(docx_path)
+            if not (pdf_path and pdf_path.exists()):
+                self._pdf_errors[record_id] = "PDF file was not created"
+                return
+        except Exception as e:
+            self._pdf_errors[record_id] = str(e)
+            return
+
+        if delete_docx:
+            try:
+                docx_path.unlink()
+                docx_path_str = ""
+            except:
+                pass  # Keep DOCX if deletion fails
+
+        self._invoices.update_files(record_id, docx_path_str or "", str(pdf_path.absolute()))
+
+    def get_pdf_status(self, invoice_id: int) -> PdfStatusResponse:
+        """Check whether a background PDF conversion has finished"""
+        error = self._pdf_errors.get(invoice_id)
+        if error:
+            return PdfStatusResponse(success=True, ready=False, error=error)
+
+        record = self._invoices.get_by_id(invoice_id)
+        if record is None:
+            return PdfStatusResponse(success=False, error="Invoice not found")
+
+        if record.pdf_path:
+            return PdfStatusResponse(
+                success=True, ready=True, pdf_filename=Path(record.pdf_path).name
+            )
+
+        return PdfStatusResponse(success=True, ready=False)
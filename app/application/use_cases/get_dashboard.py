@@ -1,5 +1,6 @@
 """Get Dashboard Use Case"""
 
+from calendar import month_name
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -9,6 +10,9 @@ from app.core.interfaces.leave_repository import LeaveRepository
 from app.core.interfaces.settings_repository import SettingsRepository
 from app.core.services.working_days_calculator import WorkingDaysCalculator
 
+# Shared fallback so default-wired use cases reuse a single calculator
+_DEFAULT_CALCULATOR = WorkingDaysCalculator()
+
 
 @dataclass
 class DashboardStats:
@@ -55,7 +59,7 @@ class GetDashboardUseCase:
         self._invoices = invoice_repository
         self._leaves = leave_repository
         self._settings = settings_repository
-        self._working_days = working_days_calculator or WorkingDaysCalculator()
+        self._working_days = working_days_calculator or _DEFAULT_CALCULATOR
 
     def execute(self) -> DashboardResponse:
         """Execute the use case"""
@@ -63,24 +67,19 @@ class GetDashboardUseCase:
             now = datetime.now()
             current_year = now.year
 
-            # Get all invoices for stats
-            all_invoices = self._invoices.get_all()
-
-            # Calculate totals
-            total_invoices = len(all_invoices)
-            total_earned = sum(inv.amount for inv in all_invoices)
+            # Get aggregate invoice stats in a single query
+            invoice_stats = self._invoices.get_stats()
 
-            # Get leaves for current year
-            leaves_this_year = self._leaves.get_all(current_year)
+            # Count leaves for current year
+            leaves_this_year = self._leaves.count(current_year)
 
             # Get last invoice
             last_invoice = None
-            if all_invoices:
-                last = all_invoices[0]  # Already sorted by created_at DESC
+            if invoice_stats.last_invoice_number is not None:
                 last_invoice = {
-                    "number": last.invoice_number,
-                    "amount": last.amount,
-                    "date": last.created_at,
+                    "number": invoice_stats.last_invoice_number,
+                    "amount": invoice_stats.last_invoice_amount,
+                    "date": invoice_stats.last_invoice_created_at,
                 }
 
             # Calculate current month working days
@@ -95,15 +94,15 @@ class GetDashboardUseCase:
             return DashboardResponse(
                 success=True,
                 stats=DashboardStats(
-                    total_invoices=total_invoices,
-                    total_earned=total_earned,
-                    leaves_this_year=len(leaves_this_year),
+                    total_invoices=invoice_stats.total_invoices,
+                    total_earned=invoice_stats.total_earned,
+                    leaves_this_year=leaves_this_year,
                     last_invoice=last_invoice,
                 ),
                 current_month=CurrentMonthInfo(
                     year=now.year,
                     month=now.month,
-                    month_name=now.strftime("%B %Y"),
+                    month_name=f"{month_name[now.month]} {now.year}",
                     total_weekdays=working_days_result.total_weekdays,
                     leaves=working_days_result.leaves,
                     working_days=working_days_result.working_days,
@@ -7,6 +7,9 @@ from typing import List, Optional
 from app.core.interfaces.leave_repository import LeaveRepository
 from app.core.services.working_days_calculator import WorkingDaysCalculator
 
+# Shared fallback so default-wired use cases reuse a single calculator
+_DEFAULT_CALCULATOR = WorkingDaysCalculator()
+
 
 @dataclass
 class WorkingDaysResponse:
@@ -29,7 +32,7 @@ class GetWorkingDaysUseCase:
         working_days_calculator: WorkingDaysCalculator = None,
     ):
         self._leaves = leave_repository
-        self._calculator = working_days_calculator or WorkingDaysCalculator()
+        self._calculator = working_days_calculator or _DEFAULT_CALCULATOR
 
     def execute(
         self, year: Optional[int] = None, month: Optional[int] = None
@@ -47,6 +47,14 @@ class ManageLeavesUseCase:
         except Exception as e:
             return LeaveResponse(success=False, error=str(e))
 
+    def add_leaves(self, requests: List[AddLeaveRequest]) -> LeavesListResponse:
+        """Add several leaves in a single transaction"""
+        try:
+            count = self._leaves.bulk_add([(r.leave_date, r.reason) for r in requests])
+            return LeavesListResponse(success=True, leaves=[], count=count)
+        except Exception as e:
+            return LeavesListResponse(success=False, error=str(e))
+
     def remove_leave(self, leave_id: int) -> LeaveResponse:
         """Remove a leave by ID"""
         try:
@@ -74,11 +82,10 @@ class ManageLeavesUseCase:
     def get_leaves_for_calendar(self, start: str, end: str) -> LeavesListResponse:
         """Get leaves for calendar view (FullCalendar)"""
         try:
-            start_str = start.split("T")[0] if "T" in start else start
-            end_str = end.split("T")[0] if "T" in end else end
-            # Convert strings to date objects
-            start_date = date.fromisoformat(start_str)
-            end_date = date.fromisoformat(end_str)
+            # FullCalendar sends either YYYY-MM-DD or a full ISO timestamp;
+            # slice off the date part without allocating a split list
+            start_date = date.fromisoformat(start[:10])
+            end_date = date.fromisoformat(end[:10])
             leaves = self._leaves.get_for_range(start_date, end_date)
             return LeavesListResponse(success=True, leaves=leaves, count=len(leaves))
         except Exception as e:
@@ -33,8 +33,7 @@ class ManageSettingsUseCase:
     def save_settings(self, data: Dict[str, Any]) -> SettingsResponse:
         """Save settings from dictionary"""
         try:
-            self._settings.save_all(data)
-            settings = self._settings.get_all()
+            settings = self._settings.save_all(data)
             return SettingsResponse(success=True, settings=settings)
         except Exception as e:
             return SettingsResponse(success=False, error=str(e))
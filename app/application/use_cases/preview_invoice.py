@@ -8,6 +8,9 @@ from app.core.entities.invoice import InvoiceInput
 from app.core.interfaces.settings_repository import SettingsRepository
 from app.core.services.invoice_calculator import InvoiceCalculator
 
+# Shared fallback so default-wired use cases reuse a single calculator
+_DEFAULT_CALCULATOR = InvoiceCalculator()
+
 
 @dataclass
 class PreviewInvoiceRequest:
@@ -46,7 +49,7 @@ class PreviewInvoiceUseCase:
         self, settings_repository: SettingsRepository, invoice_calculator: InvoiceCalculator = None
     ):
         self._settings = settings_repository
-        self._calculator = invoice_calculator or InvoiceCalculator()
+        self._calculator = invoice_calculator or _DEFAULT_CALCULATOR
 
     def execute(self, request: PreviewInvoiceRequest) -> PreviewInvoiceResponse:
         """Execute the use case"""
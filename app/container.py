@@ -5,6 +5,7 @@ Wires together all dependencies following the Dependency Inversion Principle.
 Inner layers (core, application) depend on abstractions, outer layers provide implementations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -46,6 +47,7 @@ class Container:
     document_generator: DocxGenerator
     pdf_converter: CrossPlatformPDFConverter
     html_preview_generator: HTMLPreviewGenerator
+    pdf_executor: ThreadPoolExecutor
 
     # Core Services
     invoice_calculator: InvoiceCalculator
@@ -81,6 +83,10 @@ def create_container() -> Container:
     pdf_converter = CrossPlatformPDFConverter()
     html_preview_generator = HTMLPreviewGenerator()
 
+    # Single worker: LibreOffice conversions are serialized off the request
+    # thread so /generate can respond as soon as the DOCX is written
+    pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-convert")
+
     # Core services
     working_days_calculator = WorkingDaysCalculator()
     invoice_calculator = InvoiceCalculator(working_days_calculator=working_days_calculator)
@@ -92,6 +98,7 @@ def create_container() -> Container:
         document_generator=document_generator,
         pdf_converter=pdf_converter,
         invoice_calculator=invoice_calculator,
+        pdf_executor=pdf_executor,
     )
 
     preview_invoice_use_case = PreviewInvoiceUseCase(
@@ -121,6 +128,7 @@ def create_container() -> Container:
         document_generator=document_generator,
         pdf_converter=pdf_converter,
         html_preview_generator=html_preview_generator,
+        pdf_executor=pdf_executor,
         invoice_calculator=invoice_calculator,
         working_days_calculator=working_days_calculator,
         generate_invoice_use_case=generate_invoice_use_case,
@@ -1,7 +1,8 @@
 """Invoice domain entity"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from os.path import basename
 from typing import List, Optional
 
 
@@ -37,10 +38,15 @@ class Invoice:
     amount: float
     total_payable: float
     amount_in_words: str
+    # Derived once at construction instead of formatted on every access
+    service_period: str = field(init=False, compare=False)
 
-    @property
-    def service_period(self) -> str:
-        return f"{self.service_period_start.isoformat()} to {self.service_period_end.isoformat()}"
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "service_period",
+            f"{self.service_period_start.isoformat()} to {self.service_period_end.isoformat()}",
+        )
 
 
 @dataclass
@@ -59,8 +65,6 @@ class InvoiceRecord:
     created_at: Optional[str]
 
     def to_dict(self) -> dict:
-        from pathlib import Path
-
         return {
             "id": self.id,
             "invoice_number": self.invoice_number,
@@ -70,7 +74,7 @@ class InvoiceRecord:
             "amount": self.amount,
             "docx_path": self.docx_path,
             "pdf_path": self.pdf_path,
-            "docx_filename": Path(self.docx_path).name if self.docx_path else None,
-            "pdf_filename": Path(self.pdf_path).name if self.pdf_path else None,
+            "docx_filename": basename(self.docx_path) if self.docx_path else None,
+            "pdf_filename": basename(self.pdf_path) if self.pdf_path else None,
             "created_at": self.created_at,
         }
@@ -57,11 +57,14 @@ class TemplateSection:
     order: int = 0
     collapsible: bool = False
 
+    def __post_init__(self):
+        self.fields.sort(key=lambda x: x.order)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "title": self.title,
-            "fields": [f.to_dict() for f in sorted(self.fields, key=lambda x: x.order)],
+            "fields": [f.to_dict() for f in self.fields],
             "order": self.order,
             "collapsible": self.collapsible,
         }
@@ -81,33 +84,43 @@ class InvoiceTemplate:
     description: str
     sections: List[TemplateSection] = field(default_factory=list)
     currency: str = "EUR"
+    # Lookup indexes built once; templates are treated as frozen after construction
+    _section_index: Dict[str, TemplateSection] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _field_index: Dict[str, TemplateField] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def get_section(self, section_id: str) -> Optional[TemplateSection]:
+    def __post_init__(self):
+        self.sections.sort(key=lambda x: x.order)
         for section in self.sections:
-            if section.id == section_id:
-                return section
-        return None
+            self._section_index[section.id] = section
+            for f in section.fields:
+                self._field_index[f.id] = f
+
+    def get_section(self, section_id: str) -> Optional[TemplateSection]:
+        return self._section_index.get(section_id)
 
     def get_field(self, field_id: str) -> Optional[TemplateField]:
-        for section in self.sections:
-            for f in section.fields:
-                if f.id == field_id:
-                    return f
-        return None
+        return self._field_index.get(field_id)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "sections": [s.to_dict() for s in sorted(self.sections, key=lambda x: x.order)],
+            "sections": [s.to_dict() for s in self.sections],
             "currency": self.currency,
         }
 
 
 def create_default_export_invoice_template() -> InvoiceTemplate:
-    """Create the default export invoice template"""
-    return InvoiceTemplate(
+    """Get the default export invoice template (built once at import time)"""
+    return _DEFAULT_EXPORT_INVOICE_TEMPLATE
+
+
+_DEFAULT_EXPORT_INVOICE_TEMPLATE = InvoiceTemplate(
         id="export-invoice-lut",
         name="Export Invoice (Under LUT)",
         description="Standard export services invoice for Indian freelancers",
@@ -1,6 +1,6 @@
 """Leave domain entity"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
@@ -12,21 +12,26 @@ class Leave:
     id: Optional[int]
     leave_date: date
     reason: str = ""
+    # Derived once at construction; leave_date never changes afterwards.
+    # is_weekday is True when the leave falls on Mon-Fri.
+    is_weekday: bool = field(init=False, compare=False)
+    leave_ordinal: int = field(init=False, repr=False, compare=False)
+    _iso_date: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_weekday(self) -> bool:
-        """Check if this leave falls on a weekday (Mon-Fri)"""
-        return self.leave_date.weekday() < 5
+    def __post_init__(self):
+        self.is_weekday = self.leave_date.weekday() < 5
+        self.leave_ordinal = self.leave_date.toordinal()
+        self._iso_date = self.leave_date.isoformat()
 
     def to_dict(self) -> dict:
-        return {"id": self.id, "leave_date": self.leave_date.isoformat(), "reason": self.reason}
+        return {"id": self.id, "leave_date": self._iso_date, "reason": self.reason}
 
     def to_calendar_event(self) -> dict:
         """Convert to FullCalendar event format"""
         return {
             "id": str(self.id),
             "title": self.reason or "Leave",
-            "start": self.leave_date.isoformat(),
+            "start": self._iso_date,
             "allDay": True,
             "backgroundColor": "#ef4444",
             "borderColor": "#dc2626",
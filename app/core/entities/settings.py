@@ -1,7 +1,8 @@
 """Settings domain entity"""
 
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, fields, replace
+from functools import cached_property
+from typing import Any, Dict, List
 
 
 @dataclass
@@ -70,31 +71,31 @@ class Settings:
             "setup_complete": self.setup_complete,
         }
 
+    @cached_property
+    def supplier_address_lines(self) -> List[str]:
+        """Supplier address split into non-empty display lines, computed once.
+
+        Settings instances are treated as value objects (updates go
+        through from_dict/copy_with, which build new instances), so the
+        cached split cannot go stale.
+        """
+        return [
+            line for line in self.supplier_address.replace("\\n", "\n").split("\n") if line.strip()
+        ]
+
+    def copy_with(self, **changes: Any) -> "Settings":
+        """Return a copy with the given fields replaced"""
+        return replace(self, **changes)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Settings":
         """Create Settings from dictionary, handling type conversions"""
-        return cls(
-            daily_rate=float(data.get("daily_rate", 0)),
-            currency=data.get("currency", "EUR"),
-            supplier_name=data.get("supplier_name", ""),
-            supplier_address=data.get("supplier_address", ""),
-            gstin=data.get("gstin", ""),
-            pan=data.get("pan", ""),
-            supplier_email=data.get("supplier_email", ""),
-            place_of_supply=data.get("place_of_supply", ""),
-            lut_no=data.get("lut_no", ""),
-            lut_validity=data.get("lut_validity", "2025-26"),
-            client_name=data.get("client_name", ""),
-            client_address=data.get("client_address", ""),
-            client_country=data.get("client_country", ""),
-            client_email=data.get("client_email", ""),
-            service_description=data.get(
-                "service_description", "Professional / IT / Consulting Services (SAC: 9983)"
-            ),
-            bank_name=data.get("bank_name", ""),
-            account_no=data.get("account_no", ""),
-            account_holder=data.get("account_holder", ""),
-            swift_code=data.get("swift_code", ""),
-            signatory_name=data.get("signatory_name", ""),
-            setup_complete=str(data.get("setup_complete", "false")).lower() == "true",
-        )
+        merged = {key: data.get(key, default) for key, default in _SETTINGS_DEFAULTS.items()}
+        merged["daily_rate"] = float(merged["daily_rate"] or 0)
+        merged["setup_complete"] = merged["setup_complete"] in (True, 1, "true", "True", "1")
+        return cls(**merged)
+
+
+# Field defaults derived once from the dataclass definition; keeps from_dict
+# in sync automatically when a field is added
+_SETTINGS_DEFAULTS: Dict[str, Any] = {f.name: f.default for f in fields(Settings)}
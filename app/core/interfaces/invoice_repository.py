@@ -1,12 +1,24 @@
 """Invoice repository interface (port)"""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date
 from typing import List, Optional
 
 from app.core.entities.invoice import InvoiceRecord
 
 
+@dataclass
+class InvoiceStats:
+    """Aggregate invoice statistics for the dashboard"""
+
+    total_invoices: int
+    total_earned: float
+    last_invoice_number: Optional[int] = None
+    last_invoice_amount: Optional[float] = None
+    last_invoice_created_at: Optional[str] = None
+
+
 class InvoiceRepository(ABC):
     """Interface for invoice persistence operations"""
 
@@ -30,16 +42,51 @@ class InvoiceRepository(ABC):
         """Get all invoice records ordered by creation date"""
         pass
 
+    @abstractmethod
+    def get_page(self, offset: int = 0, limit: int = 50) -> List[InvoiceRecord]:
+        """Get a page of invoice records ordered by creation date"""
+        pass
+
+    @abstractmethod
+    def get_all_as_dicts(self) -> List[dict]:
+        """Get all invoices as JSON-ready dicts, skipping entity construction"""
+        pass
+
+    @abstractmethod
+    def get_page_as_dicts(self, offset: int = 0, limit: int = 50) -> List[dict]:
+        """Get a page of invoices as JSON-ready dicts"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> InvoiceStats:
+        """Get aggregate statistics (count, total earned, last invoice)"""
+        pass
+
     @abstractmethod
     def get_by_id(self, invoice_id: int) -> Optional[InvoiceRecord]:
         """Get a specific invoice by ID"""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, ids: List[int]) -> List[InvoiceRecord]:
+        """Get several invoices in a single query"""
+        pass
+
+    @abstractmethod
+    def update_files(self, invoice_id: int, docx_path: str, pdf_path: Optional[str]) -> None:
+        """Update the stored file paths of an invoice (e.g. after async PDF conversion)"""
+        pass
+
     @abstractmethod
     def delete(self, invoice_id: int) -> bool:
         """Delete an invoice record"""
         pass
 
+    @abstractmethod
+    def delete_many(self, ids: List[int]) -> int:
+        """Delete several invoices in one transaction; returns rows removed"""
+        pass
+
     @abstractmethod
     def get_next_number(self) -> int:
         """Get the next available invoice number"""
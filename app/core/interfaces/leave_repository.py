@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.core.entities.leave import Leave
 
@@ -15,6 +15,11 @@ class LeaveRepository(ABC):
         """Add or update a leave"""
         pass
 
+    @abstractmethod
+    def bulk_add(self, entries: List[Tuple[date, str]]) -> int:
+        """Add or update several leaves in one transaction; returns rows written"""
+        pass
+
     @abstractmethod
     def remove(self, leave_id: int) -> bool:
         """Remove a leave by ID"""
@@ -44,3 +49,8 @@ class LeaveRepository(ABC):
     def get_all(self, year: Optional[int] = None) -> List[Leave]:
         """Get all leaves, optionally filtered by year"""
         pass
+
+    @abstractmethod
+    def count(self, year: int) -> int:
+        """Count leaves in a year without materializing the rows"""
+        pass
@@ -25,8 +25,8 @@ class SettingsRepository(ABC):
         pass
 
     @abstractmethod
-    def save_all(self, settings: Dict[str, Any]) -> None:
-        """Save multiple settings at once"""
+    def save_all(self, settings: Dict[str, Any]) -> Settings:
+        """Save multiple settings at once and return the resulting Settings"""
         pass
 
     @abstractmethod
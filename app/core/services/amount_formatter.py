@@ -1,6 +1,27 @@
 """Amount formatting service"""
 
-from num2words import num2words
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _amount_to_words(amount: float, currency_name: str) -> str:
+    """Convert an amount to words. Pure function of its inputs, so memoized."""
+    # num2words loads its per-language grammar modules on import; defer that
+    # to the first conversion so app (and test) startup doesn't pay for it.
+    # After the first call this is a sys.modules lookup, and the lru_cache
+    # means the body rarely runs at all.
+    from num2words import num2words
+
+    whole = int(amount)
+    cents = round((amount - whole) * 100)
+
+    whole_words = num2words(whole, lang="en").title()
+
+    if cents > 0:
+        cents_words = num2words(cents, lang="en").title()
+        return f"{whole_words} {currency_name} and {cents_words} Cents"
+
+    return f"{whole_words} {currency_name}"
 
 
 class AmountFormatter:
@@ -20,14 +41,4 @@ class AmountFormatter:
         Example: 6194.60 EUR -> "Six Thousand, One Hundred Ninety-Four Euros and Sixty Cents"
         """
         currency_name = self.CURRENCY_NAMES.get(currency.upper(), currency)
-
-        whole = int(amount)
-        cents = round((amount - whole) * 100)
-
-        whole_words = num2words(whole, lang="en").title()
-
-        if cents > 0:
-            cents_words = num2words(cents, lang="en").title()
-            return f"{whole_words} {currency_name} and {cents_words} Cents"
-
-        return f"{whole_words} {currency_name}"
+        return _amount_to_words(amount, currency_name)
@@ -1,14 +1,26 @@
 """Update Checker Service - Checks GitHub for new releases"""
 
 import json
+import os
+import time
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
 
+from app.paths import DATA_DIR
 from app.version import GITHUB_RELEASES_URL, __version__, is_newer_version
 
 
+def _default_cache_path() -> Path:
+    """Get the update-check cache path (alongside the app's other data)"""
+    invoforge_data = os.environ.get("INVOFORGE_DATA")
+    if invoforge_data:
+        return Path(invoforge_data) / "update_check.json"
+    return DATA_DIR / "update_check.json"
+
+
 @dataclass
 class UpdateInfo:
     """Information about an available update"""
@@ -27,9 +39,17 @@ class UpdateChecker:
 
     Works for desktop app deployments where the service worker
     update mechanism doesn't apply.
+
+    Responses are cached on disk with a TTL, and refreshes send a
+    conditional GET (If-None-Match) so an unchanged latest release
+    costs a 304 instead of a full payload.
     """
 
     TIMEOUT = 5  # seconds
+    CACHE_TTL = 6 * 60 * 60  # seconds
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self._cache_path = cache_path or _default_cache_path()
 
     def check_for_updates(self) -> UpdateInfo:
         """
@@ -37,62 +57,97 @@ class UpdateChecker:
 
         Returns UpdateInfo with update details or error.
         """
+        cached = self._read_cache()
+        if cached is not None and time.time() - cached.get("fetched_at", 0) < self.CACHE_TTL:
+            return self._parse_release(cached["payload"])
+
+        # Create request with User-Agent (required by GitHub API)
+        headers = {
+            "User-Agent": f"InvoForge/{__version__}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
         try:
-            # Create request with User-Agent (required by GitHub API)
-            request = urllib.request.Request(
-                GITHUB_RELEASES_URL,
-                headers={
-                    "User-Agent": f"InvoForge/{__version__}",
-                    "Accept": "application/vnd.github.v3+json",
-                },
-            )
+            request = urllib.request.Request(GITHUB_RELEASES_URL, headers=headers)
 
             with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                etag = response.headers.get("ETag")
                 data = json.loads(response.read().decode("utf-8"))
 
-            latest_version = data.get("tag_name", "").lstrip("v")
+            self._write_cache(etag, data)
+            return self._parse_release(data)
 
-            if not latest_version:
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                # Latest release unchanged; refresh the TTL and reuse the cache
+                self._write_cache(cached.get("etag"), cached["payload"])
+                return self._parse_release(cached["payload"])
+            if e.code == 404:
                 return UpdateInfo(
-                    available=False,
-                    current_version=__version__,
-                    error="Could not parse latest version",
+                    available=False, current_version=__version__, error="No releases found"
                 )
-
-            # Check if update is available
-            update_available = is_newer_version(latest_version)
-
-            # Get download URL for the appropriate asset
-            download_url = data.get("html_url", "")
-
-            # Get release notes (body)
-            release_notes = data.get("body", "")[:500]  # Truncate to 500 chars
-
             return UpdateInfo(
-                available=update_available,
-                current_version=__version__,
-                latest_version=latest_version,
-                download_url=download_url,
-                release_notes=release_notes if update_available else None,
+                available=False, current_version=__version__, error=f"GitHub API error: {e.code}"
             )
-
         except urllib.error.URLError as e:
             return UpdateInfo(
                 available=False,
                 current_version=__version__,
                 error=f"Network error: {str(e.reason)}",
             )
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return UpdateInfo(
-                    available=False, current_version=__version__, error="No releases found"
-                )
-            return UpdateInfo(
-                available=False, current_version=__version__, error=f"GitHub API error: {e.code}"
-            )
         except json.JSONDecodeError:
             return UpdateInfo(
                 available=False, current_version=__version__, error="Invalid response from GitHub"
             )
         except Exception as e:
             return UpdateInfo(available=False, current_version=__version__, error=str(e))
+
+    def _parse_release(self, data: Dict[str, Any]) -> UpdateInfo:
+        """Build UpdateInfo from a GitHub release payload"""
+        latest_version = data.get("tag_name", "").lstrip("v")
+
+        if not latest_version:
+            return UpdateInfo(
+                available=False,
+                current_version=__version__,
+                error="Could not parse latest version",
+            )
+
+        # Check if update is available
+        update_available = is_newer_version(latest_version)
+
+        # Get download URL for the appropriate asset
+        download_url = data.get("html_url", "")
+
+        # Get release notes (body)
+        release_notes = data.get("body", "")[:500]  # Truncate to 500 chars
+
+        return UpdateInfo(
+            available=update_available,
+            current_version=__version__,
+            latest_version=latest_version,
+            download_url=download_url,
+            release_notes=release_notes if update_available else None,
+        )
+
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the cached release payload, or None if absent/corrupt"""
+        try:
+            with open(self._cache_path, "r") as f:
+                cached = json.load(f)
+            if "payload" in cached:
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_cache(self, etag: Optional[str], payload: Dict[str, Any]) -> None:
+        """Persist the release payload; cache failures are non-fatal"""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path, "w") as f:
+                json.dump({"etag": etag, "fetched_at": time.time(), "payload": payload}, f)
+        except OSError:
+            pass
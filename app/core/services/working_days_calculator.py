@@ -1,13 +1,46 @@
 """Working days calculation service"""
 
 from calendar import monthrange
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from functools import cached_property, lru_cache
 from typing import List
 
 from app.core.entities.leave import Leave
 
 
+def _weekdays_between(start_date: date, end_date: date) -> int:
+    """Count weekdays (Mon-Fri) between two dates inclusive, in closed form"""
+    if start_date > end_date:
+        return 0
+
+    # Count full weeks arithmetically, then check the few leftover days
+    total_days = (end_date - start_date).days + 1
+    full_weeks, remainder = divmod(total_days, 7)
+    weekdays = full_weeks * 5
+
+    start_weekday = start_date.weekday()  # Monday = 0, Friday = 4
+    for offset in range(remainder):
+        if (start_weekday + offset) % 7 < 5:
+            weekdays += 1
+
+    return weekdays
+
+
+@lru_cache(maxsize=256)
+def _weekdays_in_month(year: int, month: int) -> int:
+    """Count weekdays (Mon-Fri) in a month. Pure function of (year, month), so memoized."""
+    _, num_days = monthrange(year, month)
+    return _weekdays_between(date(year, month, 1), date(year, month, num_days))
+
+
+@lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> tuple[date, date]:
+    """First and last day of a month. Pure function of (year, month), so memoized."""
+    _, num_days = monthrange(year, month)
+    return date(year, month, 1), date(year, month, num_days)
+
+
 @dataclass
 class WorkingDaysResult:
     """Result of working days calculation"""
@@ -15,7 +48,17 @@ class WorkingDaysResult:
     total_weekdays: int
     leaves: int
     working_days: int
-    leave_dates: List[str]
+    _leaves: List[Leave] = field(default_factory=list, repr=False, compare=False)
+
+    @cached_property
+    def leave_dates(self) -> List[str]:
+        """ISO-formatted leave dates, built on first access.
+
+        Summary callers that only read the counts skip the per-leave
+        work entirely.
+        """
+        # Leave caches the ISO string at construction; reuse it here
+        return [l._iso_date for l in self._leaves]
 
 
 class WorkingDaysCalculator:
@@ -27,15 +70,7 @@ class WorkingDaysCalculator:
 
     def calculate_weekdays(self, year: int, month: int) -> int:
         """Calculate total weekdays (Mon-Fri) in a given month"""
-        _, num_days = monthrange(year, month)
-        weekdays = 0
-
-        for day in range(1, num_days + 1):
-            d = date(year, month, day)
-            if d.weekday() < 5:  # Monday = 0, Friday = 4
-                weekdays += 1
-
-        return weekdays
+        return _weekdays_in_month(year, month)
 
     def calculate(self, year: int, month: int, leaves: List[Leave]) -> WorkingDaysResult:
         """
@@ -52,29 +87,16 @@ class WorkingDaysCalculator:
             total_weekdays=total_weekdays,
             leaves=len(weekday_leaves),
             working_days=total_weekdays - len(weekday_leaves),
-            leave_dates=[l.leave_date.isoformat() for l in leaves],
+            _leaves=leaves,
         )
 
     def get_service_period(self, reference_date: date) -> tuple[date, date]:
         """Get the service period (first and last day of month) for a given date"""
-        first_day = date(reference_date.year, reference_date.month, 1)
-        last_day_num = monthrange(reference_date.year, reference_date.month)[1]
-        last_day = date(reference_date.year, reference_date.month, last_day_num)
-        return first_day, last_day
+        return _month_bounds(reference_date.year, reference_date.month)
 
     def calculate_weekdays_for_range(self, start_date: date, end_date: date) -> int:
         """Calculate total weekdays (Mon-Fri) in a date range"""
-        from datetime import timedelta
-
-        weekdays = 0
-        current = start_date
-
-        while current <= end_date:
-            if current.weekday() < 5:  # Monday = 0, Friday = 4
-                weekdays += 1
-            current = current + timedelta(days=1)
-
-        return weekdays
+        return _weekdays_between(start_date, end_date)
 
     def calculate_for_range(
         self, start_date: date, end_date: date, leaves: List[Leave]
@@ -86,14 +108,17 @@ class WorkingDaysCalculator:
         """
         total_weekdays = self.calculate_weekdays_for_range(start_date, end_date)
 
-        # Only count leaves that fall on weekdays and within the date range
+        # Only count leaves that fall on weekdays and within the date range;
+        # compare precomputed ordinals rather than date objects
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
         weekday_leaves = [
-            l for l in leaves if l.is_weekday and start_date <= l.leave_date <= end_date
+            l for l in leaves if l.is_weekday and start_ordinal <= l.leave_ordinal <= end_ordinal
         ]
 
         return WorkingDaysResult(
             total_weekdays=total_weekdays,
             leaves=len(weekday_leaves),
             working_days=total_weekdays - len(weekday_leaves),
-            leave_dates=[l.leave_date.isoformat() for l in leaves],
+            _leaves=leaves,
         )
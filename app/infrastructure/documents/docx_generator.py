@@ -1,21 +1,56 @@
 """DOCX Document Generator Implementation"""
 
+import io
 import os
+from calendar import month_name
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from docx import Document
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_TABLE_ALIGNMENT
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Cm, Inches, Pt
 
 from app.core.entities.invoice import Invoice
 from app.core.entities.settings import Settings
 from app.core.interfaces.document_generator import DocumentGenerator
-
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+from app.paths import OUTPUT_DIR
+
+# qn() re-parses the namespace prefix on every call; resolve the names used
+# on the per-run hot path once at import
+_QN_ASCII, _QN_HANSI, _QN_EASTASIA, _QN_CS = (
+    qn("w:ascii"),
+    qn("w:hAnsi"),
+    qn("w:eastAsia"),
+    qn("w:cs"),
+)
+
+# Table borders are identical for every table; parse the XML once and
+# deepcopy the element per use instead of building six children by hand
+_TBL_BORDERS_EL = parse_xml(
+    "<w:tblBorders %s>%s</w:tblBorders>"
+    % (
+        nsdecls("w"),
+        "".join(
+            f'<w:{name} w:val="single" w:sz="4" w:space="0" w:color="000000"/>'
+            for name in ("top", "left", "bottom", "right", "insideH", "insideV")
+        ),
+    )
+)
+
+
+@lru_cache(maxsize=8)
+def _tc_mar_template(top: int, bottom: int, left: int, right: int):
+    """Parsed cell-margin element for a padding combination (cached)"""
+    margins = "".join(
+        f'<w:{name} w:w="{value}" w:type="dxa"/>'
+        for name, value in (("top", top), ("bottom", bottom), ("left", left), ("right", right))
+    )
+    return parse_xml(f"<w:tcMar {nsdecls('w')}>{margins}</w:tcMar>")
 
 
 def get_output_dir() -> Path:
@@ -24,7 +59,7 @@ def get_output_dir() -> Path:
     invoforge_data = os.environ.get("INVOFORGE_DATA")
     if invoforge_data:
         return Path(invoforge_data) / "output"
-    return PROJECT_ROOT / "output"
+    return OUTPUT_DIR
 
 
 class DocxGenerator(DocumentGenerator):
@@ -43,11 +78,28 @@ class DocxGenerator(DocumentGenerator):
     def __init__(self, output_dir: Path = None):
         self._output_dir = output_dir or get_output_dir()
         self._output_dir.mkdir(exist_ok=True)
+        self._template_bytes: Optional[bytes] = None
+
+    def _template_doc(self) -> Document:
+        """
+        Open a fresh document from the pre-configured skeleton.
+
+        Style setup and margins are invariant across invoices, so the
+        configured empty document is built and serialized once; each
+        generate call reopens it from the cached bytes instead of
+        re-running _configure_document.
+        """
+        if self._template_bytes is None:
+            doc = Document()
+            self._configure_document(doc)
+            buf = io.BytesIO()
+            doc.save(buf)
+            self._template_bytes = buf.getvalue()
+        return Document(io.BytesIO(self._template_bytes))
 
     def generate(self, invoice: Invoice, settings: Settings) -> Path:
         """Generate DOCX document and return file path"""
-        doc = Document()
-        self._configure_document(doc)
+        doc = self._template_doc()
 
         self._add_heading(doc)
         self._add_invoice_details(doc, invoice)
@@ -62,7 +114,10 @@ class DocxGenerator(DocumentGenerator):
         self._add_signature(doc, settings)
 
         filepath = self._get_filepath(invoice, settings)
-        doc.save(str(filepath))
+        # Serialize in memory and land the file in a single write
+        buf = io.BytesIO()
+        doc.save(buf)
+        filepath.write_bytes(buf.getvalue())
 
         return filepath
 
@@ -78,11 +133,7 @@ class DocxGenerator(DocumentGenerator):
 
         # Ensure font applies to all character types
         rPr = style._element.get_or_add_rPr()
-        rFonts = rPr.get_or_add_rFonts()
-        rFonts.set(qn("w:ascii"), self.FONT_NAME)
-        rFonts.set(qn("w:hAnsi"), self.FONT_NAME)
-        rFonts.set(qn("w:eastAsia"), self.FONT_NAME)
-        rFonts.set(qn("w:cs"), self.FONT_NAME)
+        self._apply_rfonts(rPr)
 
         # Set compact margins for single-page layout
         for section in doc.sections:
@@ -92,19 +143,25 @@ class DocxGenerator(DocumentGenerator):
             section.right_margin = Cm(2)
 
     def _set_font(self, run, size: Optional[Pt] = None, bold: bool = False):
-        """Apply Calibri font to a run with proper XML handling"""
-        run.font.name = self.FONT_NAME
-        run.font.size = size or self.FONT_SIZE
-        run.bold = bold
-
-        # Ensure font applies to all character types in XML
-        r = run._element
-        rPr = r.get_or_add_rPr()
+        """
+        Apply non-default font properties to a run.
+
+        The Normal style already carries Calibri at the default size
+        (with rFonts covering all character types), so runs inherit
+        that for free; only deviations need explicit run properties.
+        """
+        if size is not None and size != self.FONT_SIZE:
+            run.font.size = size
+        if bold:
+            run.bold = True
+
+    def _apply_rfonts(self, rPr):
+        """Set Calibri for all character types on an rPr element"""
         rFonts = rPr.get_or_add_rFonts()
-        rFonts.set(qn("w:ascii"), self.FONT_NAME)
-        rFonts.set(qn("w:hAnsi"), self.FONT_NAME)
-        rFonts.set(qn("w:eastAsia"), self.FONT_NAME)
-        rFonts.set(qn("w:cs"), self.FONT_NAME)
+        rFonts.set(_QN_ASCII, self.FONT_NAME)
+        rFonts.set(_QN_HANSI, self.FONT_NAME)
+        rFonts.set(_QN_EASTASIA, self.FONT_NAME)
+        rFonts.set(_QN_CS, self.FONT_NAME)
 
     def _set_paragraph_spacing(
         self, paragraph, space_after: Optional[Pt] = None, space_before: Optional[Pt] = None
@@ -127,9 +184,26 @@ class DocxGenerator(DocumentGenerator):
         p = doc.add_paragraph()
         run = p.add_run(text)
         self._set_font(run, size=size, bold=bold)
-        self._set_paragraph_spacing(p, space_after=space_after)
+        # Normal already carries the default spacing; only write deviations
+        if space_after is not None:
+            self._set_paragraph_spacing(p, space_after=space_after)
         return p
 
+    def _add_line_block(self, doc: Document, lines) -> None:
+        """Add consecutive lines as one paragraph with soft line breaks.
+
+        One paragraph with <w:br/> separators instead of a paragraph
+        per line keeps the XML tree small for multi-line blocks.
+        """
+        if not lines:
+            return
+        p = doc.add_paragraph()
+        run = p.add_run()
+        for i, line in enumerate(lines):
+            if i:
+                run.add_break()
+            run.add_text(line)
+
     def _add_heading(self, doc: Document):
         """Add centered underlined heading"""
         heading = doc.add_paragraph()
@@ -153,9 +227,7 @@ class DocxGenerator(DocumentGenerator):
     def _add_supplier_details(self, doc: Document, settings: Settings):
         """Add supplier business details"""
         self._add_paragraph(doc, settings.supplier_name)
-        for line in settings.supplier_address.replace("\\n", "\n").split("\n"):
-            if line.strip():
-                self._add_paragraph(doc, line)
+        self._add_line_block(doc, settings.supplier_address_lines)
         self._add_paragraph(doc, f"GSTIN: {settings.gstin}", space_after=Pt(1))
         self._add_paragraph(doc, f"PAN: {settings.pan}", space_after=Pt(1))
         self._add_paragraph(
@@ -191,7 +263,6 @@ class DocxGenerator(DocumentGenerator):
         self._set_font(run1, bold=True)
         run2 = p.add_run(str(invoice.total_working_days))
         self._set_font(run2)
-        self._set_paragraph_spacing(p)
 
         # Leaves taken
         p2 = doc.add_paragraph()
@@ -199,75 +270,38 @@ class DocxGenerator(DocumentGenerator):
         self._set_font(run3, bold=True)
         run4 = p2.add_run(str(invoice.leaves_taken))
         self._set_font(run4)
-        self._set_paragraph_spacing(p2)
 
         # Leave dates
-        for leave_date in invoice.leave_dates:
-            self._add_paragraph(doc, leave_date.isoformat())
+        self._add_line_block(doc, [d.isoformat() for d in invoice.leave_dates])
 
         # Section spacer
         self._add_paragraph(doc, "", space_after=self.SECTION_SPACING)
 
     def _set_table_borders(self, table):
         """Set explicit black borders on table"""
-        tbl = table._tbl
-
-        # Find or create tblPr element
-        tblPr = tbl.find(qn("w:tblPr"))
-        if tblPr is None:
-            tblPr = OxmlElement("w:tblPr")
-            tbl.insert(0, tblPr)
+        # tblPr is auto-created by python-docx; no find/insert needed
+        tblPr = table._tbl.tblPr
 
         # Remove existing borders if any
         existing_borders = tblPr.find(qn("w:tblBorders"))
         if existing_borders is not None:
             tblPr.remove(existing_borders)
 
-        # Create new borders
-        tblBorders = OxmlElement("w:tblBorders")
-
-        for border_name in ["top", "left", "bottom", "right", "insideH", "insideV"]:
-            border = OxmlElement(f"w:{border_name}")
-            border.set(qn("w:val"), "single")
-            border.set(qn("w:sz"), "4")  # 1/2 pt
-            border.set(qn("w:space"), "0")
-            border.set(qn("w:color"), "000000")
-            tblBorders.append(border)
-
-        tblPr.append(tblBorders)
+        tblPr.append(deepcopy(_TBL_BORDERS_EL))
 
     def _set_cell_padding(
         self, cell, top: int = 60, bottom: int = 60, left: int = 80, right: int = 80
     ):
         """Set cell padding in twips"""
-        tc = cell._tc
-
-        # Find or create tcPr element
-        tcPr = tc.find(qn("w:tcPr"))
-        if tcPr is None:
-            tcPr = OxmlElement("w:tcPr")
-            tc.insert(0, tcPr)
+        # tcPr is auto-created by python-docx; no find/insert needed
+        tcPr = cell._tc.get_or_add_tcPr()
 
         # Remove existing margins if any
         existing_mar = tcPr.find(qn("w:tcMar"))
         if existing_mar is not None:
             tcPr.remove(existing_mar)
 
-        # Create new margins
-        tcMar = OxmlElement("w:tcMar")
-
-        for margin_name, margin_value in [
-            ("top", top),
-            ("bottom", bottom),
-            ("left", left),
-            ("right", right),
-        ]:
-            margin = OxmlElement(f"w:{margin_name}")
-            margin.set(qn("w:w"), str(margin_value))
-            margin.set(qn("w:type"), "dxa")
-            tcMar.append(margin)
-
-        tcPr.append(tcMar)
+        tcPr.append(deepcopy(_tc_mar_template(top, bottom, left, right)))
 
     def _set_cell_content(self, cell, text: str, bold: bool = False):
         """Set cell content with proper font"""
@@ -360,8 +394,8 @@ class DocxGenerator(DocumentGenerator):
 
     def _get_filepath(self, invoice: Invoice, settings: Settings) -> Path:
         """Generate output filepath"""
-        month_name = invoice.invoice_date.strftime("%B")
+        month = month_name[invoice.invoice_date.month]
         year = invoice.invoice_date.year
         client = settings.client_name.split()[0] if settings.client_name else "Invoice"
-        filename = f"{client} Invoice - {invoice.invoice_number} - {month_name} {year}.docx"
+        filename = f"{client} Invoice - {invoice.invoice_number} - {month} {year}.docx"
         return self._output_dir / filename
@@ -7,6 +7,7 @@ of the generated DOCX document for accurate visual representation.
 
 from calendar import monthrange
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict
 
 from app.core.entities.invoice import Invoice, InvoiceRecord
@@ -14,11 +15,125 @@ from app.core.entities.settings import Settings
 from app.core.services.amount_formatter import AmountFormatter
 
 
+@lru_cache(maxsize=64)
+def _indian_fy(year: int, month: int) -> str:
+    """Indian financial-year label (April-March) for an invoice date"""
+    fy_start = year - (month < 4)
+    return f"{fy_start}-{(fy_start + 1) % 100:02d}"
+
+
+# Values used when a caller omits a key; mirrors the placeholders the
+# template showed when each kwargs.get() carried its own default
+_RENDER_DEFAULTS: Dict[str, Any] = {
+    "invoice_number": "—",
+    "invoice_date": "—",
+    "service_period_start": "—",
+    "service_period_end": "—",
+    "supplier_name": "",
+    "supplier_address_lines": [],
+    "gstin": "—",
+    "pan": "—",
+    "supplier_email": "—",
+    "place_of_supply": "—",
+    "lut_no": "—",
+    "validity_year": "—",
+    "client_name": "—",
+    "client_address": "—",
+    "client_country": "—",
+    "client_email": "—",
+    "total_working_days": 0,
+    "leaves_taken": 0,
+    "leave_dates": [],
+    "service_description": "Professional Services",
+    "days_worked": 0,
+    "rate": 0,
+    "amount": 0,
+    "currency": "EUR",
+    "amount_in_words": "—",
+    "account_holder": "—",
+    "account_no": "—",
+    "bank_name": "—",
+    "swift_code": "—",
+    "signatory_name": "",
+}
+
+# Parsed once at import; renders are a single format_map pass instead of
+# rebuilding the f-string (and its ~25 kwargs.get lookups) per call
+_TEMPLATE = """
+<div class="invoice-header">EXPORT INVOICE (UNDER LUT)</div>
+
+<div class="section">
+    <p class="line">Invoice No.: {invoice_number}</p>
+    <p class="line">Invoice Date: {invoice_date}</p>
+    <p class="line section-end">Service Period: {service_period_start} to {service_period_end}</p>
+</div>
+
+<div class="section">
+    <p class="line">{supplier_name}</p>
+    {address_html}
+    <p class="line tight">GSTIN: {gstin}</p>
+    <p class="line tight">PAN: {pan}</p>
+    <p class="line section-end">Email: {supplier_email}</p>
+</div>
+
+<div class="section">
+    <p class="line">Place of Supply: {place_of_supply}</p>
+    <p class="line">Type: Export of Services without Payment of IGST (Under LUT)</p>
+    <p class="line section-end">LUT No.: {lut_no}     Validity: FY {validity_year}</p>
+</div>
+
+<div class="section">
+    <p class="line"><strong>Bill To:</strong></p>
+    <p class="line">Name:  {client_name}</p>
+    <p class="line">Address:  {client_address}</p>
+    <p class="line section-end">Country: {client_country}    Email: {client_email}</p>
+</div>
+
+<div class="section">
+    <p class="line"><strong>Total No. of working days:</strong> {total_working_days}</p>
+    <p class="line"><strong>Leaves Taken:</strong> {leaves_taken}</p>
+    {leave_dates_html}
+    <p class="line section-end"></p>
+</div>
+
+<table class="services-table">
+    <tr>
+        <td class="header-cell"><strong>Description of Services:</strong></td>
+    </tr>
+    <tr>
+        <td class="content-cell">1. {service_description} | Days: {days_worked} | Rate: {currency} {rate:.2f} | Amount: {currency} {amount:.2f}</td>
+    </tr>
+</table>
+
+<div class="section">
+    <p class="line">Tax: Export Without Payment of IGST under LUT</p>
+    <p class="line">Total Payable ({currency}): {amount:.2f}</p>
+    <p class="line section-end">Total in Words: {amount_in_words}</p>
+</div>
+
+<div class="section">
+    <p class="line section-end">Bank Details: {account_holder} | A/c No: {account_no} | Bank: {bank_name} | SWIFT: {swift_code}</p>
+</div>
+
+<div class="section">
+    <p class="line section-end">Declaration: This invoice is issued as Export of Services without payment of IGST under LUT as per Sec. 16 of IGST Act. Payment will be received in foreign currency. No GST charged.</p>
+</div>
+
+<div class="section signature">
+    <p class="line">For {account_holder}</p>
+    <p class="line">{signature_name}</p>
+</div>
+"""
+
+
 class HTMLPreviewGenerator:
     """
     Generates HTML preview of an invoice that matches the DOCX output.
     """
 
+    def __init__(self):
+        self._formatter = AmountFormatter()
+
     def generate(self, invoice: Invoice, settings: Settings) -> str:
         """Generate HTML preview matching DOCX structure exactly"""
         return self._render_document(invoice, settings)
@@ -51,8 +166,7 @@ class HTMLPreviewGenerator:
         amount = round(days_worked * rate, 2)
 
         # Format amount in words
-        formatter = AmountFormatter()
-        amount_words = formatter.to_words(amount, settings.currency)
+        amount_words = self._formatter.to_words(amount, settings.currency)
 
         # Parse leave dates
         leave_dates = data.get("leave_dates", [])
@@ -73,7 +187,7 @@ class HTMLPreviewGenerator:
             service_period_start=first_day.isoformat(),
             service_period_end=last_day.isoformat(),
             supplier_name=settings.supplier_name,
-            supplier_address=settings.supplier_address,
+            supplier_address_lines=settings.supplier_address_lines,
             gstin=settings.gstin,
             pan=settings.pan,
             supplier_email=settings.supplier_email,
@@ -106,16 +220,10 @@ class HTMLPreviewGenerator:
         rate = record.amount / record.days_worked if record.days_worked > 0 else settings.daily_rate
 
         # Format amount in words
-        formatter = AmountFormatter()
-        amount_words = formatter.to_words(record.amount, settings.currency)
+        amount_words = self._formatter.to_words(record.amount, settings.currency)
 
         # Determine validity year from invoice date
-        year = record.invoice_date.year
-        month = record.invoice_date.month
-        if month >= 4:  # April onwards is next FY
-            validity_year = f"{year}-{str(year + 1)[-2:]}"
-        else:
-            validity_year = f"{year - 1}-{str(year)[-2:]}"
+        validity_year = _indian_fy(record.invoice_date.year, record.invoice_date.month)
 
         return self._render_html(
             invoice_number=record.invoice_number,
@@ -123,7 +231,7 @@ class HTMLPreviewGenerator:
             service_period_start=record.service_period_start.isoformat(),
             service_period_end=record.service_period_end.isoformat(),
             supplier_name=settings.supplier_name,
-            supplier_address=settings.supplier_address,
+            supplier_address_lines=settings.supplier_address_lines,
             gstin=settings.gstin,
             pan=settings.pan,
             supplier_email=settings.supplier_email,
@@ -162,7 +270,7 @@ class HTMLPreviewGenerator:
             service_period_start=invoice.service_period_start.isoformat(),
             service_period_end=invoice.service_period_end.isoformat(),
             supplier_name=settings.supplier_name,
-            supplier_address=settings.supplier_address,
+            supplier_address_lines=settings.supplier_address_lines,
             gstin=settings.gstin,
             pan=settings.pan,
             supplier_email=settings.supplier_email,
@@ -189,89 +297,27 @@ class HTMLPreviewGenerator:
             signatory_name=settings.signatory_name,
         )
 
+    @staticmethod
+    def _line_block(lines) -> str:
+        """Render consecutive lines as one paragraph with <br> separators"""
+        if not lines:
+            return ""
+        return '<p class="line">' + "<br>".join(lines) + "</p>"
+
     def _render_html(self, **kwargs) -> str:
         """Render the HTML matching DOCX structure exactly"""
+        ctx = dict(_RENDER_DEFAULTS)
+        ctx.update(kwargs)
 
-        # Format supplier address
-        address_html = ""
-        if kwargs.get("supplier_address"):
-            for line in kwargs["supplier_address"].replace("\\n", "\n").split("\n"):
-                if line.strip():
-                    address_html += f'<p class="line">{line}</p>\n'
-
-        # Format leave dates
-        leave_dates_html = ""
-        for d in kwargs.get("leave_dates", []):
-            leave_dates_html += f'<p class="line">{d}</p>\n'
+        # Single paragraphs with soft breaks, mirroring the DOCX output
+        ctx["address_html"] = self._line_block(ctx["supplier_address_lines"])
+        ctx["leave_dates_html"] = self._line_block(ctx["leave_dates"])
 
         # Get signature name - use signatory_name if set, otherwise fall back to supplier_name
-        signature_name = kwargs.get("signatory_name", "")
-        if not signature_name and kwargs.get("supplier_name"):
+        signature_name = ctx["signatory_name"]
+        if not signature_name and ctx["supplier_name"]:
             # Extract name without parenthetical as fallback
-            signature_name = kwargs["supplier_name"].split("(")[0].strip()
-
-        return f"""
-<div class="invoice-header">EXPORT INVOICE (UNDER LUT)</div>
-
-<div class="section">
-    <p class="line">Invoice No.: {kwargs.get("invoice_number", "—")}</p>
-    <p class="line">Invoice Date: {kwargs.get("invoice_date", "—")}</p>
-    <p class="line section-end">Service Period: {kwargs.get("service_period_start", "—")} to {kwargs.get("service_period_end", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line">{kwargs.get("supplier_name", "")}</p>
-    {address_html}
-    <p class="line tight">GSTIN: {kwargs.get("gstin", "—")}</p>
-    <p class="line tight">PAN: {kwargs.get("pan", "—")}</p>
-    <p class="line section-end">Email: {kwargs.get("supplier_email", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line">Place of Supply: {kwargs.get("place_of_supply", "—")}</p>
-    <p class="line">Type: Export of Services without Payment of IGST (Under LUT)</p>
-    <p class="line section-end">LUT No.: {kwargs.get("lut_no", "—")}     Validity: FY {kwargs.get("validity_year", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line"><strong>Bill To:</strong></p>
-    <p class="line">Name:  {kwargs.get("client_name", "—")}</p>
-    <p class="line">Address:  {kwargs.get("client_address", "—")}</p>
-    <p class="line section-end">Country: {kwargs.get("client_country", "—")}    Email: {kwargs.get("client_email", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line"><strong>Total No. of working days:</strong> {kwargs.get("total_working_days", 0)}</p>
-    <p class="line"><strong>Leaves Taken:</strong> {kwargs.get("leaves_taken", 0)}</p>
-    {leave_dates_html}
-    <p class="line section-end"></p>
-</div>
-
-<table class="services-table">
-    <tr>
-        <td class="header-cell"><strong>Description of Services:</strong></td>
-    </tr>
-    <tr>
-        <td class="content-cell">1. {kwargs.get("service_description", "Professional Services")} | Days: {kwargs.get("days_worked", 0)} | Rate: {kwargs.get("currency", "EUR")} {kwargs.get("rate", 0):.2f} | Amount: {kwargs.get("currency", "EUR")} {kwargs.get("amount", 0):.2f}</td>
-    </tr>
-</table>
-
-<div class="section">
-    <p class="line">Tax: Export Without Payment of IGST under LUT</p>
-    <p class="line">Total Payable ({kwargs.get("currency", "EUR")}): {kwargs.get("amount", 0):.2f}</p>
-    <p class="line section-end">Total in Words: {kwargs.get("amount_in_words", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line section-end">Bank Details: {kwargs.get("account_holder", "—")} | A/c No: {kwargs.get("account_no", "—")} | Bank: {kwargs.get("bank_name", "—")} | SWIFT: {kwargs.get("swift_code", "—")}</p>
-</div>
-
-<div class="section">
-    <p class="line section-end">Declaration: This invoice is issued as Export of Services without payment of IGST under LUT as per Sec. 16 of IGST Act. Payment will be received in foreign currency. No GST charged.</p>
-</div>
+            signature_name = ctx["supplier_name"].split("(")[0].strip()
+        ctx["signature_name"] = signature_name
 
-<div class="section signature">
-    <p class="line">For {kwargs.get("account_holder", "—")}</p>
-    <p class="line">{signature_name}</p>
-</div>
-"""
+        return _TEMPLATE.format_map(ctx)
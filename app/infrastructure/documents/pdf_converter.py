@@ -10,15 +10,61 @@ Supported platforms:
 - Linux: LibreOffice → unoconv → wkhtmltopdf
 """
 
+import hashlib
 import platform
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from app.core.interfaces.pdf_converter import PDFConverter
 
+# Resolve docx2pdf once at import; availability cannot change mid-process
+try:
+    from docx2pdf import convert as _docx2pdf_convert
+except ImportError:
+    _docx2pdf_convert = None
+
+
+@lru_cache(maxsize=1)
+def _discover_soffice() -> Optional[str]:
+    """Locate the LibreOffice executable (probed once per process)"""
+    system = platform.system()
+
+    if system == "Darwin":  # macOS
+        paths = [
+            "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+            "/Applications/OpenOffice.app/Contents/MacOS/soffice",
+        ]
+    elif system == "Windows":
+        paths = [
+            r"C:\Program Files\LibreOffice\program\soffice.exe",
+            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+        ]
+    else:  # Linux and others
+        paths = [
+            "/usr/bin/libreoffice",
+            "/usr/bin/soffice",
+            "/usr/local/bin/libreoffice",
+            "/opt/libreoffice/program/soffice",
+            "/snap/bin/libreoffice",
+        ]
+
+    # Check explicit paths first
+    for path in paths:
+        if Path(path).is_file():
+            return path
+
+    # Try PATH lookup
+    for cmd in ["libreoffice", "soffice"]:
+        found = shutil.which(cmd)
+        if found:
+            return found
+
+    return None
+
 
 class ConversionStrategy(ABC):
     """Abstract base class for PDF conversion strategies"""
@@ -51,18 +97,13 @@ class DocxToPdfStrategy(ConversionStrategy):
         return "docx2pdf (MS Word)"
 
     def is_available(self) -> bool:
-        try:
-            from docx2pdf import convert  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return _docx2pdf_convert is not None
 
     def convert(self, source_path: Path, output_path: Path) -> bool:
+        if _docx2pdf_convert is None:
+            return False
         try:
-            from docx2pdf import convert
-
-            convert(str(source_path), str(output_path))
+            _docx2pdf_convert(str(source_path), str(output_path))
             return output_path.exists()
         except Exception:
             return False
@@ -79,45 +120,9 @@ class LibreOfficeStrategy(ConversionStrategy):
         return "LibreOffice"
 
     def is_available(self) -> bool:
-        self._executable = self._find_executable()
+        self._executable = _discover_soffice()
         return self._executable is not None
 
-    def _find_executable(self) -> Optional[str]:
-        """Find LibreOffice executable based on platform"""
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            paths = [
-                "/Applications/LibreOffice.app/Contents/MacOS/soffice",
-                "/Applications/OpenOffice.app/Contents/MacOS/soffice",
-            ]
-        elif system == "Windows":
-            paths = [
-                r"C:\Program Files\LibreOffice\program\soffice.exe",
-                r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-            ]
-        else:  # Linux and others
-            paths = [
-                "/usr/bin/libreoffice",
-                "/usr/bin/soffice",
-                "/usr/local/bin/libreoffice",
-                "/opt/libreoffice/program/soffice",
-                "/snap/bin/libreoffice",
-            ]
-
-        # Check explicit paths first
-        for path in paths:
-            if Path(path).is_file():
-                return path
-
-        # Try PATH lookup
-        for cmd in ["libreoffice", "soffice"]:
-            found = shutil.which(cmd)
-            if found:
-                return found
-
-        return None
-
     def convert(self, source_path: Path, output_path: Path) -> bool:
         if not self._executable:
             return False
@@ -133,7 +138,11 @@ class LibreOfficeStrategy(ConversionStrategy):
                     str(source_path.parent),
                     str(source_path),
                 ],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True,
                 timeout=120,
                 check=False,
             )
@@ -156,7 +165,11 @@ class UnoconvStrategy(ConversionStrategy):
         try:
             result = subprocess.run(
                 ["unoconv", "-f", "pdf", "-o", str(output_path), str(source_path)],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True,
                 timeout=120,
                 check=False,
             )
@@ -223,6 +236,14 @@ class CrossPlatformPDFConverter(PDFConverter):
         """
         output_path = source_path.with_suffix(".pdf")
 
+        # Identical DOCX bytes always produce the same PDF, so repeat
+        # conversions are served from a content-addressed cache
+        digest = hashlib.sha256(source_path.read_bytes()).hexdigest()
+        cache_path = source_path.parent / ".pdf-cache" / f"{digest}.pdf"
+        if cache_path.is_file():
+            shutil.copyfile(cache_path, output_path)
+            return output_path
+
         available = self.get_available_strategies()
 
         if not available:
@@ -235,6 +256,7 @@ class CrossPlatformPDFConverter(PDFConverter):
         for strategy in available:
             try:
                 if strategy.convert(source_path, output_path):
+                    self._store_in_cache(output_path, cache_path)
                     return output_path
                 errors.append(f"{strategy.name}: conversion returned no file")
             except Exception as e:
@@ -244,6 +266,15 @@ class CrossPlatformPDFConverter(PDFConverter):
         error_details = "; ".join(errors)
         raise RuntimeError(f"PDF conversion failed. Tried: {error_details}")
 
+    @staticmethod
+    def _store_in_cache(output_path: Path, cache_path: Path) -> None:
+        """Keep a copy of the converted PDF; cache failures are non-fatal"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_path)
+        except OSError:
+            pass
+
     def get_converter_info(self) -> dict:
         """Get information about available converters (useful for diagnostics)"""
         return {
@@ -2,12 +2,14 @@
 
 import os
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "invoices.db"
+from app.paths import DATA_DIR
+
+DEFAULT_DB_PATH = DATA_DIR / "invoices.db"
 
 
 def get_db_path() -> Path:
@@ -34,18 +36,45 @@ class Database:
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or get_db_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_schema()
 
+    # Per-connection tuning: WAL lets readers run while a write commits,
+    # synchronous=NORMAL is safe under WAL and cuts fsync cost, mmap_size
+    # serves page reads from the OS page cache without read() syscalls,
+    # and the rest keep temp data and the page cache in memory.
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or lazily open) this thread's persistent connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Reusing the connection keeps SQLite's internal prepared-statement
+            # cache warm, so hot queries skip re-parsing and re-planning
+            conn = sqlite3.connect(str(self.db_path), cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            for pragma in self._PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with automatic commit/close"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get the thread's database connection with automatic commit/rollback"""
+        conn = self._get_connection()
         try:
             yield conn
             conn.commit()
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
 
     def _init_schema(self):
         """Initialize database schema"""
@@ -76,6 +105,18 @@ class Database:
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_invoice_date ON invoices(invoice_date)")
+            # Covering index for the dashboard's "last invoice" lookup:
+            # satisfies ORDER BY created_at DESC LIMIT 1 without touching the table
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_invoice_created
+                ON invoices(created_at DESC, invoice_number, amount)
+                """
+            )
+            # Index for MAX(invoice_number) / next-number lookups
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_invoice_number ON invoices(invoice_number)"
+            )
 
             # Settings table
             conn.execute("""
@@ -1,18 +1,28 @@
 """SQLite Invoice Repository Implementation"""
 
+import sqlite3
+import threading
 from datetime import date, datetime
+from os.path import basename
 from typing import List, Optional
 
 from app.core.entities.invoice import InvoiceRecord
-from app.core.interfaces.invoice_repository import InvoiceRepository
+from app.core.interfaces.invoice_repository import InvoiceRepository, InvoiceStats
 from app.infrastructure.persistence.database import Database
 
+# RETURNING needs SQLite >= 3.35; older builds fall back to lastrowid
+# plus a Python-side timestamp
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class SQLiteInvoiceRepository(InvoiceRepository):
     """SQLite implementation of InvoiceRepository"""
 
     def __init__(self, database: Database):
         self._db = database
+        # Cached MAX(invoice_number); maintained on save, dropped on delete
+        self._last_number: Optional[int] = None
+        self._number_lock = threading.Lock()
 
     def save(
         self,
@@ -25,27 +35,38 @@ class SQLiteInvoiceRepository(InvoiceRepository):
         docx_path: str,
         pdf_path: Optional[str] = None,
     ) -> InvoiceRecord:
+        params = (
+            invoice_number,
+            invoice_date.isoformat(),
+            service_period_start.isoformat(),
+            service_period_end.isoformat(),
+            days_worked,
+            amount,
+            docx_path,
+            pdf_path,
+        )
+        insert_sql = """
+            INSERT INTO invoices
+            (invoice_number, invoice_date, service_period_start, service_period_end,
+             days_worked, amount, docx_path, pdf_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """
+
         with self._db.connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO invoices
-                (invoice_number, invoice_date, service_period_start, service_period_end,
-                 days_worked, amount, docx_path, pdf_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    invoice_number,
-                    invoice_date.isoformat(),
-                    service_period_start.isoformat(),
-                    service_period_end.isoformat(),
-                    days_worked,
-                    amount,
-                    docx_path,
-                    pdf_path,
-                ),
-            )
+            if _SUPPORTS_RETURNING:
+                # Fetch the DB-assigned timestamp in the same round-trip so the
+                # record matches what a later SELECT would return
+                row = conn.execute(insert_sql + "RETURNING id, created_at", params).fetchone()
+                record_id, created_at = row["id"], row["created_at"]
+            else:
+                cursor = conn.execute(insert_sql, params)
+                record_id, created_at = cursor.lastrowid, datetime.now().isoformat()
+
+            with self._number_lock:
+                if self._last_number is not None:
+                    self._last_number = max(self._last_number, invoice_number)
             return InvoiceRecord(
-                id=cursor.lastrowid,
+                id=record_id,
                 invoice_number=invoice_number,
                 invoice_date=invoice_date,
                 service_period_start=service_period_start,
@@ -54,7 +75,7 @@ class SQLiteInvoiceRepository(InvoiceRepository):
                 amount=amount,
                 docx_path=docx_path,
                 pdf_path=pdf_path,
-                created_at=datetime.now().isoformat(),
+                created_at=created_at,
             )
 
     def get_all(self) -> List[InvoiceRecord]:
@@ -68,7 +89,80 @@ class SQLiteInvoiceRepository(InvoiceRepository):
                 """
             ).fetchall()
 
-            return [self._row_to_record(row) for row in rows]
+            # Bind the mapper once; avoids a method lookup per row
+            to_record = self._row_to_record
+            return [to_record(row) for row in rows]
+
+    def get_page(self, offset: int = 0, limit: int = 50) -> List[InvoiceRecord]:
+        with self._db.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, invoice_number, invoice_date, service_period_start,
+                       service_period_end, days_worked, amount, docx_path, pdf_path, created_at
+                FROM invoices
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset),
+            ).fetchall()
+
+            # Bind the mapper once; avoids a method lookup per row
+            to_record = self._row_to_record
+            return [to_record(row) for row in rows]
+
+    def get_all_as_dicts(self) -> List[dict]:
+        with self._db.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, invoice_number, invoice_date, service_period_start,
+                       service_period_end, days_worked, amount, docx_path, pdf_path, created_at
+                FROM invoices
+                ORDER BY created_at DESC
+                """
+            ).fetchall()
+
+            to_dict = self._row_to_dict
+            return [to_dict(row) for row in rows]
+
+    def get_page_as_dicts(self, offset: int = 0, limit: int = 50) -> List[dict]:
+        with self._db.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, invoice_number, invoice_date, service_period_start,
+                       service_period_end, days_worked, amount, docx_path, pdf_path, created_at
+                FROM invoices
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset),
+            ).fetchall()
+
+            to_dict = self._row_to_dict
+            return [to_dict(row) for row in rows]
+
+    def get_stats(self) -> InvoiceStats:
+        with self._db.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM invoices) AS total_invoices,
+                    (SELECT COALESCE(SUM(amount), 0) FROM invoices) AS total_earned,
+                    (SELECT invoice_number FROM invoices
+                     ORDER BY created_at DESC LIMIT 1) AS last_number,
+                    (SELECT amount FROM invoices
+                     ORDER BY created_at DESC LIMIT 1) AS last_amount,
+                    (SELECT created_at FROM invoices
+                     ORDER BY created_at DESC LIMIT 1) AS last_created_at
+                """
+            ).fetchone()
+
+            return InvoiceStats(
+                total_invoices=row["total_invoices"],
+                total_earned=row["total_earned"],
+                last_invoice_number=row["last_number"],
+                last_invoice_amount=row["last_amount"],
+                last_invoice_created_at=row["last_created_at"],
+            )
 
     def get_by_id(self, invoice_id: int) -> Optional[InvoiceRecord]:
         with self._db.connection() as conn:
@@ -83,18 +177,88 @@ class SQLiteInvoiceRepository(InvoiceRepository):
 
             return self._row_to_record(row) if row else None
 
+    def get_by_ids(self, ids: List[int]) -> List[InvoiceRecord]:
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        with self._db.connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, invoice_number, invoice_date, service_period_start,
+                       service_period_end, days_worked, amount, docx_path, pdf_path, created_at
+                FROM invoices WHERE id IN ({placeholders})
+                """,
+                ids,
+            ).fetchall()
+
+            to_record = self._row_to_record
+            return [to_record(row) for row in rows]
+
+    def update_files(self, invoice_id: int, docx_path: str, pdf_path: Optional[str]) -> None:
+        with self._db.connection() as conn:
+            conn.execute(
+                "UPDATE invoices SET docx_path = ?, pdf_path = ? WHERE id = ?",
+                (docx_path, pdf_path, invoice_id),
+            )
+
     def delete(self, invoice_id: int) -> bool:
         with self._db.connection() as conn:
             cursor = conn.execute("DELETE FROM invoices WHERE id = ?", (invoice_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        if deleted:
+            # The deleted invoice may have held the max number; recompute lazily
+            with self._number_lock:
+                self._last_number = None
+        return deleted
+
+    def delete_many(self, ids: List[int]) -> int:
+        if not ids:
+            return 0
+        placeholders = ",".join("?" * len(ids))
+        with self._db.connection() as conn:
+            # One DELETE ... IN (...) in one transaction instead of a
+            # statement (and commit) per invoice
+            cursor = conn.execute(f"DELETE FROM invoices WHERE id IN ({placeholders})", ids)
+            deleted = cursor.rowcount
+        if deleted:
+            # A deleted invoice may have held the max number; recompute lazily
+            with self._number_lock:
+                self._last_number = None
+        return deleted
 
     def get_next_number(self) -> int:
         return self.get_last_number() + 1
 
     def get_last_number(self) -> int:
-        with self._db.connection() as conn:
-            row = conn.execute("SELECT MAX(invoice_number) as max_num FROM invoices").fetchone()
-            return row["max_num"] if row and row["max_num"] else 0
+        with self._number_lock:
+            if self._last_number is None:
+                with self._db.connection() as conn:
+                    row = conn.execute(
+                        "SELECT MAX(invoice_number) as max_num FROM invoices"
+                    ).fetchone()
+                    self._last_number = row["max_num"] if row and row["max_num"] else 0
+            return self._last_number
+
+    @staticmethod
+    def _row_to_dict(row) -> dict:
+        # Mirrors InvoiceRecord.to_dict() but works on the raw TEXT columns:
+        # dates are stored as ISO strings, so listing endpoints can skip the
+        # fromisoformat/isoformat round trip and the dataclass construction
+        docx_path = row["docx_path"]
+        pdf_path = row["pdf_path"]
+        return {
+            "id": row["id"],
+            "invoice_number": row["invoice_number"],
+            "invoice_date": row["invoice_date"],
+            "service_period": f"{row['service_period_start']} to {row['service_period_end']}",
+            "days_worked": row["days_worked"],
+            "amount": row["amount"],
+            "docx_path": docx_path,
+            "pdf_path": pdf_path,
+            "docx_filename": basename(docx_path) if docx_path else None,
+            "pdf_filename": basename(pdf_path) if pdf_path else None,
+            "created_at": row["created_at"],
+        }
 
     def _row_to_record(self, row) -> InvoiceRecord:
         return InvoiceRecord(
@@ -1,7 +1,7 @@
 """SQLite Leave Repository Implementation"""
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.core.entities.leave import Leave
 from app.core.interfaces.leave_repository import LeaveRepository
@@ -22,6 +22,18 @@ class SQLiteLeaveRepository(LeaveRepository):
             )
             return Leave(id=cursor.lastrowid, leave_date=leave_date, reason=reason)
 
+    def bulk_add(self, entries: List[Tuple[date, str]]) -> int:
+        if not entries:
+            return 0
+        with self._db.connection() as conn:
+            # One executemany in one transaction: a multi-day vacation costs
+            # a single commit instead of one per day
+            cursor = conn.executemany(
+                "INSERT OR REPLACE INTO leaves (leave_date, reason) VALUES (?, ?)",
+                [(leave_date.isoformat(), reason) for leave_date, reason in entries],
+            )
+            return cursor.rowcount
+
     def remove(self, leave_id: int) -> bool:
         with self._db.connection() as conn:
             cursor = conn.execute("DELETE FROM leaves WHERE id = ?", (leave_id,))
@@ -60,7 +72,8 @@ class SQLiteLeaveRepository(LeaveRepository):
                 (start_date, end_date),
             ).fetchall()
 
-            return [self._row_to_leave(row) for row in rows]
+            to_leave = self._row_to_leave
+            return [to_leave(row) for row in rows]
 
     def get_for_range(self, start_date: date, end_date: date) -> List[Leave]:
         with self._db.connection() as conn:
@@ -73,7 +86,8 @@ class SQLiteLeaveRepository(LeaveRepository):
                 (start_date.isoformat(), end_date.isoformat()),
             ).fetchall()
 
-            return [self._row_to_leave(row) for row in rows]
+            to_leave = self._row_to_leave
+            return [to_leave(row) for row in rows]
 
     def get_all(self, year: Optional[int] = None) -> List[Leave]:
         with self._db.connection() as conn:
@@ -91,7 +105,16 @@ class SQLiteLeaveRepository(LeaveRepository):
                     "SELECT id, leave_date, reason FROM leaves ORDER BY leave_date DESC"
                 ).fetchall()
 
-            return [self._row_to_leave(row) for row in rows]
+            to_leave = self._row_to_leave
+            return [to_leave(row) for row in rows]
+
+    def count(self, year: int) -> int:
+        with self._db.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n FROM leaves WHERE leave_date >= ? AND leave_date < ?",
+                (f"{year}-01-01", f"{year + 1}-01-01"),
+            ).fetchone()
+            return row["n"]
 
     def _row_to_leave(self, row) -> Leave:
         return Leave(
@@ -1,6 +1,6 @@
 """SQLite Settings Repository Implementation"""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from app.core.entities.settings import Settings
 from app.core.interfaces.settings_repository import SettingsRepository
@@ -8,10 +8,17 @@ from app.infrastructure.persistence.database import Database
 
 
 class SQLiteSettingsRepository(SettingsRepository):
-    """SQLite implementation of SettingsRepository"""
+    """
+    SQLite implementation of SettingsRepository.
+
+    Settings change rarely but are read on nearly every request (rate,
+    currency, setup flag), so `get_all()` results are cached in-process
+    and invalidated on any write.
+    """
 
     def __init__(self, database: Database):
         self._db = database
+        self._cached: Optional[Settings] = None
 
     def get(self, key: str, default: str = "") -> str:
         with self._db.connection() as conn:
@@ -21,21 +28,37 @@ class SQLiteSettingsRepository(SettingsRepository):
     def set(self, key: str, value: str) -> None:
         with self._db.connection() as conn:
             conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+        self._cached = None
 
     def get_all(self) -> Settings:
+        if self._cached is not None:
+            return self._cached
+
         with self._db.connection() as conn:
             rows = conn.execute("SELECT key, value FROM settings").fetchall()
             data = {row["key"]: row["value"] for row in rows}
-            return Settings.from_dict(data)
+            self._cached = Settings.from_dict(data)
+            return self._cached
+
+    def save_all(self, settings: Dict[str, Any]) -> Settings:
+        # Merge onto the current values so the returned Settings is complete
+        # even for partial updates, without re-reading the table afterwards
+        data = self.get_all().to_dict()
+
+        rows = []
+        for key, value in settings.items():
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            rows.append((key, str(value)))
+            data[key] = str(value)
 
-    def save_all(self, settings: Dict[str, Any]) -> None:
         with self._db.connection() as conn:
-            for key, value in settings.items():
-                if isinstance(value, bool):
-                    value = "true" if value else "false"
-                conn.execute(
-                    "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value))
-                )
+            # One executemany keeps the whole batch a single statement
+            # dispatch and a single commit
+            conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", rows)
+
+        self._cached = Settings.from_dict(data)
+        return self._cached
 
     def is_setup_complete(self) -> bool:
         return self.get("setup_complete", "false").lower() == "true"
@@ -0,0 +1,16 @@
+"""Filesystem locations resolved once at import.
+
+Several modules used to rebuild the project root independently with
+``Path(__file__).parent`` chains. Computing the constants here keeps the
+layout in one place and gives packaged builds a single module to patch if
+resources ever move.
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DATA_DIR = PROJECT_ROOT / "data"
+OUTPUT_DIR = PROJECT_ROOT / "output"
+STATIC_DIR = PROJECT_ROOT / "static"
+TEMPLATES_DIR = PROJECT_ROOT / "app" / "templates"
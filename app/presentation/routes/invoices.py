@@ -1,6 +1,8 @@
 """Invoice API routes"""
 
-from datetime import datetime
+import hashlib
+import os
+from datetime import date
 from pathlib import Path
 
 from flask import Blueprint, jsonify, request, send_file
@@ -9,29 +11,36 @@ from app.application.use_cases.generate_invoice import GenerateInvoiceRequest
 from app.application.use_cases.preview_invoice import PreviewInvoiceRequest
 from app.container import get_container
 from app.infrastructure.documents.docx_generator import get_output_dir
+from app.presentation.routes.settings import get_settings_version
 
 invoices_bp = Blueprint("invoices", __name__)
 
+# The live preview fires on keystrokes and tab switches and often re-submits
+# an identical payload; remember the last rendered HTML keyed on a digest of
+# the raw body plus the settings generation, and skip the re-render.
+# Kept as a single (key, html) tuple read and replaced in one assignment so
+# concurrent requests (the dev server runs threaded) can never pair one
+# request's key with another's html.
+_preview_cache = (None, None)
+
 
 @invoices_bp.route("/generate", methods=["POST"])
 def generate():
     """Generate a new invoice"""
-    data = request.json
+    data = request.get_json(cache=False)
     container = get_container()
 
     try:
-        invoice_date = datetime.strptime(data["invoice_date"], "%Y-%m-%d").date()
-        leave_dates = [datetime.strptime(d, "%Y-%m-%d").date() for d in data.get("leave_dates", [])]
+        invoice_date = date.fromisoformat(data["invoice_date"])
+        leave_dates = [date.fromisoformat(d) for d in data.get("leave_dates", [])]
 
         # Parse optional service period
         service_period_start = None
         service_period_end = None
         if data.get("service_period_start"):
-            service_period_start = datetime.strptime(
-                data["service_period_start"], "%Y-%m-%d"
-            ).date()
+            service_period_start = date.fromisoformat(data["service_period_start"])
         if data.get("service_period_end"):
-            service_period_end = datetime.strptime(data["service_period_end"], "%Y-%m-%d").date()
+            service_period_end = date.fromisoformat(data["service_period_end"])
 
         req = GenerateInvoiceRequest(
             invoice_number=int(data["invoice_number"]),
@@ -52,6 +61,7 @@ def generate():
             return jsonify(
                 {
                     "success": True,
+                    "invoice_id": response.invoice_id,
                     "invoice": {
                         "number": response.invoice.invoice_number,
                         "date": response.invoice.invoice_date.isoformat(),
@@ -63,6 +73,7 @@ def generate():
                     "files": {
                         "docx": response.docx_filename,
                         "pdf": response.pdf_filename,
+                        "pdf_pending": response.pdf_pending,
                         "pdf_error": response.pdf_error,
                     },
                 }
@@ -77,22 +88,20 @@ def generate():
 @invoices_bp.route("/preview", methods=["POST"])
 def preview():
     """Preview invoice calculations"""
-    data = request.json
+    data = request.get_json(cache=False)
     container = get_container()
 
     try:
-        invoice_date = datetime.strptime(data["invoice_date"], "%Y-%m-%d").date()
-        leave_dates = [datetime.strptime(d, "%Y-%m-%d").date() for d in data.get("leave_dates", [])]
+        invoice_date = date.fromisoformat(data["invoice_date"])
+        leave_dates = [date.fromisoformat(d) for d in data.get("leave_dates", [])]
 
         # Parse optional service period
         service_period_start = None
         service_period_end = None
         if data.get("service_period_start"):
-            service_period_start = datetime.strptime(
-                data["service_period_start"], "%Y-%m-%d"
-            ).date()
+            service_period_start = date.fromisoformat(data["service_period_start"])
         if data.get("service_period_end"):
-            service_period_end = datetime.strptime(data["service_period_end"], "%Y-%m-%d").date()
+            service_period_end = date.fromisoformat(data["service_period_end"])
 
         req = PreviewInvoiceRequest(
             invoice_number=int(data["invoice_number"]),
@@ -131,7 +140,14 @@ def preview():
 @invoices_bp.route("/preview-html", methods=["POST"])
 def preview_html():
     """Generate live HTML preview of the invoice"""
-    data = request.json
+    global _preview_cache
+
+    cache_key = (hashlib.sha256(request.get_data()).digest(), get_settings_version())
+    cached_key, cached_html = _preview_cache
+    if cache_key == cached_key:
+        return jsonify({"success": True, "html": cached_html})
+
+    data = request.get_json(cache=False)
     container = get_container()
 
     try:
@@ -139,11 +155,12 @@ def preview_html():
 
         # Parse the date
         if data.get("invoice_date"):
-            data["invoice_date"] = datetime.strptime(data["invoice_date"], "%Y-%m-%d").date()
+            data["invoice_date"] = date.fromisoformat(data["invoice_date"])
 
         # Generate HTML preview
         html = container.html_preview_generator.generate_from_data(data, settings)
 
+        _preview_cache = (cache_key, html)
         return jsonify({"success": True, "html": html})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -151,15 +168,34 @@ def preview_html():
 
 @invoices_bp.route("/invoices", methods=["GET"])
 def list_invoices():
-    """List all invoices"""
+    """List invoices, optionally paginated via ?page=N&per_page=M"""
     container = get_container()
 
+    page = request.args.get("page", type=int)
+    per_page = request.args.get("per_page", default=50, type=int)
+
     try:
-        invoices = container.invoice_repository.get_all()
+        if page:
+            # Push the slice into SQL so large histories stay constant-cost
+            invoices = container.invoice_repository.get_page_as_dicts(
+                offset=(page - 1) * per_page, limit=per_page
+            )
+            total = container.invoice_repository.get_stats().total_invoices
+            return jsonify(
+                {
+                    "success": True,
+                    "invoices": invoices,
+                    "count": total,
+                    "page": page,
+                    "per_page": per_page,
+                }
+            )
+
+        invoices = container.invoice_repository.get_all_as_dicts()
         return jsonify(
             {
                 "success": True,
-                "invoices": [inv.to_dict() for inv in invoices],
+                "invoices": invoices,
                 "count": len(invoices),
             }
         )
@@ -203,6 +239,67 @@ def delete_invoice(invoice_id: int):
         return jsonify({"success": False, "error": str(e)}), 400
 
 
+@invoices_bp.route("/invoices/bulk-delete", methods=["POST"])
+def bulk_delete_invoices():
+    """Delete several invoices and their files in one pass"""
+    data = request.get_json(cache=False)
+    container = get_container()
+
+    try:
+        ids = [int(i) for i in data.get("ids", [])]
+        if not ids:
+            return jsonify({"success": False, "error": "No invoice IDs provided"}), 400
+
+        # One SELECT for all file paths instead of a get_by_id per invoice
+        invoices = container.invoice_repository.get_by_ids(ids)
+        found_ids = {inv.id for inv in invoices}
+
+        for invoice in invoices:
+            for file_path in (invoice.docx_path, invoice.pdf_path):
+                if file_path:
+                    # Unlink directly and catch ENOENT: skipping the
+                    # exists() pre-check saves a stat per file
+                    try:
+                        os.unlink(file_path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        print(f"Warning: Could not delete file {file_path}: {e}")
+
+        container.invoice_repository.delete_many(list(found_ids))
+
+        return jsonify(
+            {
+                "success": True,
+                "deleted": sorted(found_ids),
+                "failed": [i for i in ids if i not in found_ids],
+                "next_invoice_number": container.invoice_repository.get_next_number(),
+            }
+        )
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@invoices_bp.route("/invoices/<int:invoice_id>/pdf-status")
+def pdf_status(invoice_id: int):
+    """Check the status of a background PDF conversion"""
+    container = get_container()
+
+    response = container.generate_invoice_use_case.get_pdf_status(invoice_id)
+
+    if not response.success:
+        return jsonify({"success": False, "error": response.error}), 404
+
+    return jsonify(
+        {
+            "success": True,
+            "ready": response.ready,
+            "pdf": response.pdf_filename,
+            "error": response.error,
+        }
+    )
+
+
 @invoices_bp.route("/next-invoice-number")
 def next_invoice_number():
     """Get the next invoice number"""
@@ -239,4 +336,14 @@ def download(filename: str):
     if not filepath.exists():
         return jsonify({"error": f"File not found: {filename}"}), 404
 
-    return send_file(str(filepath.absolute()), as_attachment=True, download_name=filename)
+    # conditional=True enables ETag/Range handling (304s and resumable
+    # downloads), and lets werkzeug use os.sendfile so the bytes never
+    # pass through Python; max_age=0 makes browsers revalidate via ETag
+    return send_file(
+        filepath,
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
+        etag=True,
+        max_age=0,
+    )
@@ -1,6 +1,6 @@
 """Leave API routes"""
 
-from datetime import datetime
+from datetime import date
 
 from flask import Blueprint, jsonify, request
 
@@ -9,6 +9,20 @@ from app.container import get_container
 
 leaves_bp = Blueprint("leaves", __name__)
 
+# The leave set only changes through this module's POST/DELETE handlers, so
+# serialized calendar events are cached per (start, end) window and the whole
+# cache is dropped by bumping a version counter on any write. The version also
+# doubles as an ETag so calendar pans can be answered with a bodyless 304.
+_leaves_version = 0
+_events_cache: dict = {}
+_EVENTS_CACHE_MAX = 64
+
+
+def _bump_leaves_version() -> None:
+    global _leaves_version
+    _leaves_version += 1
+    _events_cache.clear()
+
 
 @leaves_bp.route("/leaves", methods=["GET"])
 def list_leaves():
@@ -51,36 +65,71 @@ def leaves_events():
     start = request.args.get("start", "")
     end = request.args.get("end", "")
 
-    try:
-        if start and end:
-            response = container.leaves_use_case.get_leaves_for_calendar(start, end)
-        else:
-            response = container.leaves_use_case.get_all_leaves()
-
-        if response.success:
-            events = [l.to_calendar_event() for l in response.leaves]
-            return jsonify(events)
-        else:
+    version = _leaves_version
+    etag = f"{version}-{start}-{end}"
+    if request.if_none_match.contains_weak(etag):
+        return "", 304
+
+    key = (start, end)
+    events = _events_cache.get(key)
+    if events is None:
+        try:
+            if start and end:
+                response = container.leaves_use_case.get_leaves_for_calendar(start, end)
+            else:
+                response = container.leaves_use_case.get_all_leaves()
+
+            events = [l.to_calendar_event() for l in response.leaves] if response.success else []
+        except Exception:
             return jsonify([])
 
-    except Exception:
-        return jsonify([])
+        # Only cache if no write landed while we were querying; a stale
+        # insert here would outlive the cache clear in _bump_leaves_version
+        # and be re-served under the new version's ETag
+        if version == _leaves_version:
+            if len(_events_cache) >= _EVENTS_CACHE_MAX:
+                _events_cache.clear()
+            _events_cache[key] = events
+
+    resp = jsonify(events)
+    resp.set_etag(etag, weak=True)
+    return resp
 
 
 @leaves_bp.route("/leaves", methods=["POST"])
 def add_leave():
     """Add a new leave"""
-    data = request.json
+    data = request.get_json(cache=False)
     container = get_container()
 
     try:
-        leave_date = datetime.strptime(data["leave_date"], "%Y-%m-%d").date()
         reason = data.get("reason", "")
 
+        # A request body with leave_dates marks a whole block (e.g. a
+        # vacation) in one transaction
+        dates = data.get("leave_dates")
+        if dates:
+            reqs = [
+                AddLeaveRequest(
+                    leave_date=date.fromisoformat(d), reason=reason
+                )
+                for d in dates
+            ]
+            response = container.leaves_use_case.add_leaves(reqs)
+
+            if response.success:
+                _bump_leaves_version()
+                return jsonify({"success": True, "count": response.count})
+            else:
+                return jsonify({"success": False, "error": response.error}), 400
+
+        leave_date = date.fromisoformat(data["leave_date"])
+
         req = AddLeaveRequest(leave_date=leave_date, reason=reason)
         response = container.leaves_use_case.add_leave(req)
 
         if response.success:
+            _bump_leaves_version()
             return jsonify({"success": True, "leave": response.leave.to_dict()})
         else:
             return jsonify({"success": False, "error": response.error}), 400
@@ -96,6 +145,8 @@ def delete_leave(leave_id: int):
 
     try:
         response = container.leaves_use_case.remove_leave(leave_id)
+        if response.success:
+            _bump_leaves_version()
         return jsonify({"success": response.success})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -107,8 +158,10 @@ def delete_leave_by_date(leave_date: str):
     container = get_container()
 
     try:
-        date_obj = datetime.strptime(leave_date, "%Y-%m-%d").date()
+        date_obj = date.fromisoformat(leave_date)
         response = container.leaves_use_case.remove_leave_by_date(date_obj)
+        if response.success:
+            _bump_leaves_version()
         return jsonify({"success": response.success})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -128,8 +181,8 @@ def working_days():
     try:
         if start_date_str and end_date_str:
             # Use date range
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+            start_date = date.fromisoformat(start_date_str)
+            end_date = date.fromisoformat(end_date_str)
             response = container.working_days_use_case.execute_for_range(start_date, end_date)
         else:
             # Use year/month (backwards compatible)
@@ -2,12 +2,13 @@
 
 import os
 import signal
+import time
 from datetime import datetime
-from pathlib import Path
 
-from flask import Blueprint, jsonify, redirect, render_template, url_for
+from flask import Blueprint, Response, jsonify, redirect, render_template, url_for
 
 from app.container import get_container
+from app.paths import STATIC_DIR
 from app.version import COPYRIGHT_START_YEAR, __version__
 
 pages_bp = Blueprint("pages", __name__)
@@ -18,41 +19,54 @@ def is_standalone_mode() -> bool:
     return os.environ.get("INVOFORGE_DATA") is not None
 
 
+# The year changes once every ~8760 hours; re-check the wall clock at most
+# hourly instead of on every page render
+_year_cache = {"ts": float("-inf"), "val": COPYRIGHT_START_YEAR}
+
+
 def get_copyright_year():
     """
     Get the copyright year, ensuring it's never less than the app's release year.
     Protects against incorrect system clocks showing past dates.
     """
-    return max(COPYRIGHT_START_YEAR, datetime.now().year)
+    now = time.monotonic()
+    if now - _year_cache["ts"] > 3600.0:
+        _year_cache["val"] = max(COPYRIGHT_START_YEAR, datetime.now().year)
+        _year_cache["ts"] = now
+    return _year_cache["val"]
+
+
+# Fixed for the process lifetime; merged into every render context
+_TEMPLATE_BASE = {"version": __version__}
 
 
 def get_template_context(**kwargs):
     """Get common template context with version and year"""
     return {
-        "version": __version__,
+        **_TEMPLATE_BASE,
         "year": get_copyright_year(),
         "is_standalone": is_standalone_mode(),
         **kwargs,
     }
 
 
-# Static directory for PWA assets
-STATIC_DIR = Path(__file__).parent.parent.parent.parent / "static"
+# Both the file and __version__ are immutable for the process lifetime, so
+# read the service worker and substitute the version once at import
+try:
+    _SW_BODY = (
+        (STATIC_DIR / "sw.js").read_text().replace("{{VERSION}}", __version__).encode("utf-8")
+    )
+except OSError:
+    _SW_BODY = None
 
 
 @pages_bp.route("/sw.js")
 def service_worker():
-    """Serve service worker from root with dynamic version injection"""
-    from flask import Response
+    """Serve service worker from root with the version pre-substituted"""
+    if _SW_BODY is None:
+        return jsonify({"error": "Service worker not found"}), 404
 
-    sw_path = STATIC_DIR / "sw.js"
-    with open(sw_path, "r") as f:
-        content = f.read()
-
-    # Inject version from single source of truth
-    content = content.replace("{{VERSION}}", __version__)
-
-    return Response(content, mimetype="application/javascript")
+    return Response(_SW_BODY, mimetype="application/javascript")
 
 
 @pages_bp.route("/")
@@ -137,15 +151,13 @@ def quit_app():
     if not is_standalone_mode():
         return jsonify({"error": "Only available in standalone mode"}), 403
 
-    def shutdown():
-        """Shutdown after response is sent"""
-        import time
+    resp = jsonify({"success": True, "message": "Shutting down..."})
 
-        time.sleep(0.5)
+    # The WSGI server closes the response iterable only after the body has
+    # been written to the socket, so signalling from call_on_close shuts
+    # down right behind the flush — no half-second sleep, no extra thread
+    @resp.call_on_close
+    def _shutdown():
         os.kill(os.getpid(), signal.SIGTERM)
 
-    import threading
-
-    threading.Thread(target=shutdown, daemon=True).start()
-
-    return jsonify({"success": True, "message": "Shutting down..."})
+    return resp
@@ -6,6 +6,14 @@ from app.container import get_container
 
 settings_bp = Blueprint("settings", __name__)
 
+# Bumped on every successful save; lets other modules key caches on the
+# current settings generation without re-reading the settings themselves
+_settings_version = 0
+
+
+def get_settings_version() -> int:
+    return _settings_version
+
 
 @settings_bp.route("/config")
 def get_config():
@@ -36,13 +44,15 @@ def get_settings():
 @settings_bp.route("/settings", methods=["POST"])
 def save_settings():
     """Save settings"""
-    data = request.json
+    data = request.get_json(cache=False)
     container = get_container()
 
     try:
         response = container.settings_use_case.save_settings(data)
 
         if response.success:
+            global _settings_version
+            _settings_version += 1
             return jsonify({"success": True})
         else:
             return jsonify({"success": False, "error": response.error}), 400
@@ -9,17 +9,9 @@ import socket
 import sys
 import threading
 import time
-import webbrowser
 from pathlib import Path
 
 
-def get_resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    if hasattr(sys, "_MEIPASS"):
-        return Path(sys._MEIPASS) / relative_path
-    return Path(__file__).parent / relative_path
-
-
 def get_user_data_dir() -> Path:
     """
     Get the user data directory for storing app data.
@@ -54,15 +46,19 @@ def setup_paths():
         os.environ["FLASK_TEMPLATE_PATH"] = str(base_path / "app" / "templates")
         os.environ["FLASK_STATIC_PATH"] = str(base_path / "static")
 
-        env_example = base_path / ".env.example"
         user_data = get_user_data_dir()
-        user_data.mkdir(parents=True, exist_ok=True)
-
         user_env = user_data / ".env"
-        if not user_env.exists() and env_example.exists():
-            import shutil
 
-            shutil.copy(env_example, user_env)
+        # Warm launches pay one exists() here; the mkdir and template copy
+        # only run on first start (Database creates the data dir itself)
+        if not user_env.exists():
+            user_data.mkdir(parents=True, exist_ok=True)
+            env_example = base_path / ".env.example"
+            if env_example.exists():
+                import shutil
+
+                # copyfile skips copy()'s extra stat + chmod of the mode bits
+                shutil.copyfile(env_example, user_env)
 
         os.environ["INVOFORGE_DATA"] = str(user_data)
         os.environ["DOTENV_PATH"] = str(user_env)
@@ -70,46 +66,95 @@ def setup_paths():
 
 def is_port_in_use(port: int) -> bool:
     """Check if a port is already in use"""
+    # A connect probe is cheaper than bind+close (no address to tear down,
+    # no TIME_WAIT residue) and answers instantly on loopback: a free port
+    # gets an immediate RST from the kernel
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind(("127.0.0.1", port))
-            return False
-        except OSError:
-            return True
+        s.settimeout(0.25)
+        return s.connect_ex(("127.0.0.1", port)) == 0
 
 
-def is_invoforge_running(port: int) -> bool:
-    """Check if InvoForge is already running on the port"""
-    try:
-        import urllib.request
+def probe_port(port: int) -> str:
+    """
+    Classify a port in a single connection: "free", "invoforge", or "other".
+
+    Replaces the old two-step check (bind probe, then urllib GET on a second
+    connection) with one connect followed by a raw HTTP/1.0 request — no
+    urllib import graph, one TCP handshake instead of two.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(0.25)
+        if s.connect_ex(("127.0.0.1", port)) != 0:
+            return "free"
+
+        try:
+            s.settimeout(2)
+            s.sendall(b"GET /api/settings HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n")
+            head = s.recv(256)
+        except OSError:
+            return "other"
 
-        with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/settings", timeout=2) as response:
-            return response.status == 200
-    except Exception:
-        return False
+    if head.startswith(b"HTTP/1.") and b" 200 " in head[:32]:
+        return "invoforge"
+    return "other"
 
 
 def open_browser(port: int):
-    """Open browser after a short delay"""
-    time.sleep(1.5)
+    """Open browser once the server is accepting connections"""
+    # Poll for readiness instead of a blind 1.5s sleep: werkzeug typically
+    # binds within ~100ms, and on slow machines the old delay could fire
+    # before the server was even listening
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.1)
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                break
+        time.sleep(0.025)
+
+    # webbrowser drags in shlex/subprocess; importing here keeps it off the
+    # startup-critical path
+    import webbrowser
+
     webbrowser.open(f"http://127.0.0.1:{port}")
 
 
 def main():
-    setup_paths()
-
     sys.path.insert(0, str(Path(__file__).parent))
 
+    # The Flask import graph dominates cold start, and it is independent of
+    # the filesystem setup and port probes below; pulling it in on a worker
+    # thread makes startup cost max(import, probes) instead of their sum.
+    # Nothing in the app package reads INVOFORGE_DATA at import time (only
+    # inside create_app and the path getters), so overlapping is safe.
+    imported = {}
+
+    def _import_create_app():
+        from app import create_app
+
+        imported["create_app"] = create_app
+
+    import_thread = threading.Thread(target=_import_create_app, daemon=True)
+    import_thread.start()
+
+    setup_paths()
+
     port = 5050
 
-    # Check if port is already in use
-    if is_port_in_use(port):
-        # Check if it's InvoForge running
-        if is_invoforge_running(port):
-            print(f"\n{'=' * 50}")
-            print("  InvoForge is already running!")
-            print(f"{'=' * 50}")
-            print(f"\n  Opening browser at: http://127.0.0.1:{port}\n")
+    # Classify the primary port with a single connection
+    status = probe_port(port)
+    if status != "free":
+        if status == "invoforge":
+            # One write + flush instead of a lock/write/flush per print
+            sys.stdout.write(
+                f"\n{'=' * 50}\n"
+                "  InvoForge is already running!\n"
+                f"{'=' * 50}\n"
+                f"\n  Opening browser at: http://127.0.0.1:{port}\n\n"
+            )
+            sys.stdout.flush()
+            import webbrowser
+
             webbrowser.open(f"http://127.0.0.1:{port}")
             return
         else:
@@ -125,19 +170,24 @@ def main():
                 input("  Press Enter to exit...")
                 return
 
-    from app import create_app
-
-    app = create_app()
+    import_thread.join()
+    app = imported["create_app"]()
 
     threading.Thread(target=open_browser, args=(port,), daemon=True).start()
 
-    print(f"\n{'=' * 50}")
-    print("  InvoForge is running!")
-    print(f"{'=' * 50}")
-    print(f"\n  Open your browser at: http://127.0.0.1:{port}")
-    print("\n  Press Ctrl+C to quit\n")
-
-    app.run(host="127.0.0.1", port=port, debug=False, use_reloader=False)
+    sys.stdout.write(
+        f"\n{'=' * 50}\n"
+        "  InvoForge is running!\n"
+        f"{'=' * 50}\n"
+        f"\n  Open your browser at: http://127.0.0.1:{port}\n"
+        "\n  Press Ctrl+C to quit\n\n"
+    )
+    sys.stdout.flush()
+
+    # threaded=True lets page loads and API calls proceed while a slow
+    # request (e.g. a LibreOffice PDF conversion) holds another thread;
+    # werkzeug's default is one request at a time
+    app.run(host="127.0.0.1", port=port, debug=False, use_reloader=False, threaded=True)
 
 
 if __name__ == "__main__":
@@ -27,4 +27,12 @@ if __name__ == "__main__":
     print("\n  Open your browser at: http://127.0.0.1:5665\n")
 
     app = create_app()
-    app.run(debug=True, port=5665)
+
+    # Opt into the debugger and reloader explicitly: the reloader forks a
+    # watcher process that stats every imported module each poll cycle
+    app.run(
+        debug=bool(os.environ.get("INVOFORGE_DEBUG")),
+        port=5665,
+        threaded=True,
+        use_reloader=bool(os.environ.get("INVOFORGE_RELOAD")),
+    )
@@ -464,7 +464,7 @@ class InvoiceApp {
             const result = await response.json();
 
             if (result.success) {
-                this.showDownloads(result.files);
+                this.showDownloads(result.files, result.invoice_id);
             } else {
                 alert('Error: ' + result.error);
             }
@@ -491,7 +491,7 @@ class InvoiceApp {
         }
     }
 
-    showDownloads(files) {
+    showDownloads(files, invoiceId) {
         this.downloadSection.classList.remove('hidden');
 
         const docxLink = document.getElementById('download-docx');
@@ -509,6 +509,12 @@ class InvoiceApp {
         if (files.pdf) {
             pdfLink.href = `/api/download/${files.pdf}`;
             pdfLink.classList.remove('hidden', 'disabled');
+        } else if (files.pdf_pending && invoiceId) {
+            // PDF is converting in the background - show a disabled link and poll
+            pdfLink.removeAttribute('href');
+            pdfLink.classList.remove('hidden');
+            pdfLink.classList.add('disabled');
+            this.pollPdfStatus(invoiceId, pdfLink);
         } else {
             pdfLink.classList.add('hidden');
         }
@@ -521,6 +527,35 @@ class InvoiceApp {
         this.downloadSection.scrollIntoView({ behavior: 'smooth', block: 'center' });
     }
 
+    async pollPdfStatus(invoiceId, pdfLink, attempt = 0) {
+        if (attempt > 120) {
+            console.warn('PDF generation timed out');
+            pdfLink.classList.add('hidden');
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/invoices/${invoiceId}/pdf-status`);
+            const status = await response.json();
+
+            if (status.ready && status.pdf) {
+                pdfLink.href = `/api/download/${status.pdf}`;
+                pdfLink.classList.remove('disabled');
+                return;
+            }
+
+            if (status.error) {
+                console.warn('PDF generation issue:', status.error);
+                pdfLink.classList.add('hidden');
+                return;
+            }
+        } catch (error) {
+            console.error('PDF status error:', error);
+        }
+
+        setTimeout(() => this.pollPdfStatus(invoiceId, pdfLink, attempt + 1), 1000);
+    }
+
     // ==================== Leave Calendar ====================
     initLeaveCalendar() {
         const calendarEl = document.getElementById('calendar');
@@ -21,9 +21,9 @@ from app.core.services.working_days_calculator import WorkingDaysCalculator
 # ============================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create Flask app for testing."""
+    """Create Flask app once per session; create_app() is the expensive part."""
     app = create_app()
     app.config["TESTING"] = True
     return app
@@ -40,19 +40,22 @@ def app_client(app):
 # ============================================
 
 
-@pytest.fixture
+# The services are stateless, so one instance can serve the whole session
+
+
+@pytest.fixture(scope="session")
 def working_days_calculator() -> WorkingDaysCalculator:
-    """Fresh working days calculator instance."""
+    """Shared working days calculator instance."""
     return WorkingDaysCalculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def amount_formatter() -> AmountFormatter:
-    """Fresh amount formatter instance."""
+    """Shared amount formatter instance."""
     return AmountFormatter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invoice_calculator(
     working_days_calculator: WorkingDaysCalculator,
     amount_formatter: AmountFormatter,
@@ -69,19 +72,19 @@ def invoice_calculator(
 # ============================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_leave() -> Leave:
     """A sample leave on a weekday (Monday)."""
     return Leave(id=1, leave_date=date(2025, 1, 6), reason="Personal day")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_weekend_leave() -> Leave:
     """A sample leave on a weekend (Saturday)."""
     return Leave(id=2, leave_date=date(2025, 1, 4), reason="Weekend")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_settings() -> Settings:
     """Sample settings for testing - all fake/placeholder data."""
     return Settings(
@@ -108,7 +111,7 @@ def sample_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_invoice_input() -> InvoiceInput:
     """Sample invoice input for testing - uses round numbers for easy verification."""
     return InvoiceInput(
@@ -122,7 +125,7 @@ def sample_invoice_input() -> InvoiceInput:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def january_2025_leaves() -> list[Leave]:
     """List of leaves in January 2025 for testing."""
     return [
@@ -0,0 +1,39 @@
+"""
+Hand-written repository stubs for use-case tests.
+
+Plain classes instead of unittest.mock.Mock: constructing one is a couple
+of attribute assignments rather than Mock's __getattr__ interception and
+call-record bookkeeping, and a mistyped method name fails loudly with
+AttributeError instead of silently returning a child Mock.
+"""
+
+from typing import List, Optional
+
+from app.core.entities.leave import Leave
+from app.core.entities.settings import Settings
+
+
+class StubLeaveRepository:
+    """Returns canned leaves, or raises an injected error."""
+
+    def __init__(self, leaves: List[Leave] = (), error: Optional[Exception] = None):
+        self._leaves = list(leaves)
+        self._error = error
+
+    def get_for_month(self, year: int, month: int) -> List[Leave]:
+        if self._error is not None:
+            raise self._error
+        return list(self._leaves)
+
+
+class StubSettingsRepository:
+    """Returns canned settings, or raises an injected error."""
+
+    def __init__(self, settings: Optional[Settings] = None, error: Optional[Exception] = None):
+        self._settings = settings
+        self._error = error
+
+    def get_all(self) -> Settings:
+        if self._error is not None:
+            raise self._error
+        return self._settings
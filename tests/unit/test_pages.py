@@ -15,14 +15,12 @@ class TestIsStandaloneMode:
             # Re-import to get fresh evaluation
             assert is_standalone_mode() is True
 
-    def test_returns_false_when_invoforge_data_not_set(self):
+    def test_returns_false_when_invoforge_data_not_set(self, monkeypatch):
         """Should return False when INVOFORGE_DATA env var is not set"""
-        env = os.environ.copy()
-        env.pop("INVOFORGE_DATA", None)
-        with patch.dict(os.environ, env, clear=True):
-            from app.presentation.routes.pages import is_standalone_mode
+        monkeypatch.delenv("INVOFORGE_DATA", raising=False)
+        from app.presentation.routes.pages import is_standalone_mode
 
-            assert is_standalone_mode() is False
+        assert is_standalone_mode() is False
 
 
 class TestQuitEndpoint:
@@ -9,7 +9,6 @@ Tests cover:
 """
 
 from datetime import date
-from unittest.mock import Mock
 
 from app.application.use_cases.get_working_days import GetWorkingDaysUseCase
 from app.application.use_cases.preview_invoice import (
@@ -20,21 +19,21 @@ from app.core.entities.leave import Leave
 from app.core.entities.settings import Settings
 from app.core.services.invoice_calculator import InvoiceCalculator
 from app.core.services.working_days_calculator import WorkingDaysCalculator
+from tests.unit._stubs import StubLeaveRepository, StubSettingsRepository
+
+# The shared session-scoped service fixtures live in tests/conftest.py;
+# the services are stateless, so every test can use the same instance.
 
 
 class TestGetWorkingDaysUseCase:
     """Tests for GetWorkingDaysUseCase."""
 
-    def test_returns_working_days_for_month(self):
+    def test_returns_working_days_for_month(self, working_days_calculator: WorkingDaysCalculator):
         """Use case returns correct working days calculation."""
         # Arrange
-        mock_leave_repo = Mock()
-        mock_leave_repo.get_for_month.return_value = []
-
-        calculator = WorkingDaysCalculator()
         use_case = GetWorkingDaysUseCase(
-            leave_repository=mock_leave_repo,
-            working_days_calculator=calculator,
+            leave_repository=StubLeaveRepository(leaves=[]),
+            working_days_calculator=working_days_calculator,
         )
 
         # Act
@@ -46,19 +45,19 @@ class TestGetWorkingDaysUseCase:
         assert result.leaves == 0
         assert result.working_days == 23
 
-    def test_subtracts_weekday_leaves(self):
+    def test_subtracts_weekday_leaves(self, working_days_calculator: WorkingDaysCalculator):
         """Weekday leaves are subtracted from working days."""
         # Arrange
-        mock_leave_repo = Mock()
-        mock_leave_repo.get_for_month.return_value = [
-            Leave(id=1, leave_date=date(2025, 1, 6), reason="Test"),  # Monday
-            Leave(id=2, leave_date=date(2025, 1, 7), reason="Test"),  # Tuesday
-        ]
+        leave_repo = StubLeaveRepository(
+            leaves=[
+                Leave(id=1, leave_date=date(2025, 1, 6), reason="Test"),  # Monday
+                Leave(id=2, leave_date=date(2025, 1, 7), reason="Test"),  # Tuesday
+            ]
+        )
 
-        calculator = WorkingDaysCalculator()
         use_case = GetWorkingDaysUseCase(
-            leave_repository=mock_leave_repo,
-            working_days_calculator=calculator,
+            leave_repository=leave_repo,
+            working_days_calculator=working_days_calculator,
         )
 
         # Act
@@ -69,18 +68,18 @@ class TestGetWorkingDaysUseCase:
         assert result.leaves == 2
         assert result.working_days == 21  # 23 - 2
 
-    def test_ignores_weekend_leaves(self):
+    def test_ignores_weekend_leaves(self, working_days_calculator: WorkingDaysCalculator):
         """Weekend leaves don't affect working days count."""
         # Arrange
-        mock_leave_repo = Mock()
-        mock_leave_repo.get_for_month.return_value = [
-            Leave(id=1, leave_date=date(2025, 1, 4), reason="Saturday"),
-        ]
+        leave_repo = StubLeaveRepository(
+            leaves=[
+                Leave(id=1, leave_date=date(2025, 1, 4), reason="Saturday"),
+            ]
+        )
 
-        calculator = WorkingDaysCalculator()
         use_case = GetWorkingDaysUseCase(
-            leave_repository=mock_leave_repo,
-            working_days_calculator=calculator,
+            leave_repository=leave_repo,
+            working_days_calculator=working_days_calculator,
         )
 
         # Act
@@ -90,15 +89,12 @@ class TestGetWorkingDaysUseCase:
         assert result.leaves == 0  # Weekend not counted
         assert result.working_days == 23
 
-    def test_handles_repository_error(self):
+    def test_handles_repository_error(self, working_days_calculator: WorkingDaysCalculator):
         """Returns error response when repository fails."""
         # Arrange
-        mock_leave_repo = Mock()
-        mock_leave_repo.get_for_month.side_effect = Exception("Database error")
-
         use_case = GetWorkingDaysUseCase(
-            leave_repository=mock_leave_repo,
-            working_days_calculator=WorkingDaysCalculator(),
+            leave_repository=StubLeaveRepository(error=Exception("Database error")),
+            working_days_calculator=working_days_calculator,
         )
 
         # Act
@@ -108,17 +104,20 @@ class TestGetWorkingDaysUseCase:
         assert result.success is False
         assert "Database error" in result.error
 
-    def test_returns_leave_dates_in_response(self):
+    def test_returns_leave_dates_in_response(
+        self, working_days_calculator: WorkingDaysCalculator
+    ):
         """Leave dates are included in response."""
         # Arrange
-        mock_leave_repo = Mock()
-        mock_leave_repo.get_for_month.return_value = [
-            Leave(id=1, leave_date=date(2025, 1, 6), reason="Test"),
-        ]
+        leave_repo = StubLeaveRepository(
+            leaves=[
+                Leave(id=1, leave_date=date(2025, 1, 6), reason="Test"),
+            ]
+        )
 
         use_case = GetWorkingDaysUseCase(
-            leave_repository=mock_leave_repo,
-            working_days_calculator=WorkingDaysCalculator(),
+            leave_repository=leave_repo,
+            working_days_calculator=working_days_calculator,
         )
 
         # Act
@@ -131,22 +130,22 @@ class TestGetWorkingDaysUseCase:
 class TestPreviewInvoiceUseCase:
     """Tests for PreviewInvoiceUseCase."""
 
-    def _create_mock_settings_repo(self, settings: Settings = None) -> Mock:
-        """Helper to create mock settings repository."""
-        mock_repo = Mock()
-        mock_repo.get_all.return_value = settings or Settings(
-            daily_rate=100.00,
-            currency="EUR",
+    def _create_settings_repo(self, settings: Settings = None) -> StubSettingsRepository:
+        """Helper to create a stub settings repository."""
+        return StubSettingsRepository(
+            settings=settings
+            or Settings(
+                daily_rate=100.00,
+                currency="EUR",
+            )
         )
-        return mock_repo
 
-    def test_returns_invoice_preview(self):
+    def test_returns_invoice_preview(self, invoice_calculator: InvoiceCalculator):
         """Use case returns correct invoice preview."""
         # Arrange
-        mock_settings = self._create_mock_settings_repo()
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=self._create_settings_repo(),
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
@@ -168,13 +167,13 @@ class TestPreviewInvoiceUseCase:
         assert result.amount == "2100.00"
         assert "2025-01-01 to 2025-01-31" in result.service_period
 
-    def test_uses_provided_rate_over_settings(self):
+    def test_uses_provided_rate_over_settings(self, invoice_calculator: InvoiceCalculator):
         """Rate from request takes precedence over settings."""
         # Arrange
-        mock_settings = self._create_mock_settings_repo(Settings(daily_rate=50.00, currency="EUR"))
+        settings_repo = self._create_settings_repo(Settings(daily_rate=50.00, currency="EUR"))
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=settings_repo,
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
@@ -193,13 +192,13 @@ class TestPreviewInvoiceUseCase:
         # Assert
         assert result.amount == "2000.00"  # 20 * 100, not 20 * 50
 
-    def test_falls_back_to_settings_rate(self):
+    def test_falls_back_to_settings_rate(self, invoice_calculator: InvoiceCalculator):
         """Uses settings rate when request rate is None."""
         # Arrange
-        mock_settings = self._create_mock_settings_repo(Settings(daily_rate=75.00, currency="EUR"))
+        settings_repo = self._create_settings_repo(Settings(daily_rate=75.00, currency="EUR"))
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=settings_repo,
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
@@ -218,13 +217,13 @@ class TestPreviewInvoiceUseCase:
         # Assert
         assert result.amount == "1500.00"  # 20 * 75
 
-    def test_uses_settings_currency(self):
+    def test_uses_settings_currency(self, invoice_calculator: InvoiceCalculator):
         """Currency from settings is used in formatting."""
         # Arrange
-        mock_settings = self._create_mock_settings_repo(Settings(daily_rate=100.00, currency="USD"))
+        settings_repo = self._create_settings_repo(Settings(daily_rate=100.00, currency="USD"))
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=settings_repo,
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
@@ -243,15 +242,14 @@ class TestPreviewInvoiceUseCase:
         # Assert
         assert "Dollars" in result.amount_in_words
 
-    def test_handles_settings_repository_error(self):
+    def test_handles_settings_repository_error(self, invoice_calculator: InvoiceCalculator):
         """Returns error response when settings repository fails."""
         # Arrange
-        mock_settings = Mock()
-        mock_settings.get_all.side_effect = Exception("Settings not found")
+        settings_repo = StubSettingsRepository(error=Exception("Settings not found"))
 
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=settings_repo,
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
@@ -271,13 +269,12 @@ class TestPreviewInvoiceUseCase:
         assert result.success is False
         assert "Settings not found" in result.error
 
-    def test_amount_in_words_included(self):
+    def test_amount_in_words_included(self, invoice_calculator: InvoiceCalculator):
         """Amount in words is included in response."""
         # Arrange
-        mock_settings = self._create_mock_settings_repo()
         use_case = PreviewInvoiceUseCase(
-            settings_repository=mock_settings,
-            invoice_calculator=InvoiceCalculator(),
+            settings_repository=self._create_settings_repo(),
+            invoice_calculator=invoice_calculator,
         )
 
         request = PreviewInvoiceRequest(
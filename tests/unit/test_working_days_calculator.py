@@ -10,6 +10,8 @@ Tests cover:
 
 from datetime import date
 
+import pytest
+
 from app.core.entities.leave import Leave
 from app.core.services.working_days_calculator import WorkingDaysCalculator
 
@@ -17,32 +19,22 @@ from app.core.services.working_days_calculator import WorkingDaysCalculator
 class TestCalculateWeekdays:
     """Tests for calculate_weekdays method."""
 
-    def test_january_2025_has_23_weekdays(self, working_days_calculator: WorkingDaysCalculator):
-        """January 2025 starts on Wednesday, has 23 weekdays."""
-        result = working_days_calculator.calculate_weekdays(2025, 1)
-        assert result == 23
-
-    def test_february_2025_has_20_weekdays(self, working_days_calculator: WorkingDaysCalculator):
-        """February 2025 is not a leap year, has 20 weekdays."""
-        result = working_days_calculator.calculate_weekdays(2025, 2)
-        assert result == 20
-
-    def test_february_2024_leap_year_has_21_weekdays(
-        self, working_days_calculator: WorkingDaysCalculator
+    @pytest.mark.parametrize(
+        "year,month,expected",
+        [
+            (2025, 1, 23),  # January 2025 starts on Wednesday
+            (2025, 2, 20),  # February 2025 is not a leap year
+            (2024, 2, 21),  # February 2024 is a leap year with 29 days
+            (2025, 4, 22),  # April 2025 has 30 days
+            (2025, 12, 23),
+        ],
+    )
+    def test_weekdays_in_month(
+        self, working_days_calculator: WorkingDaysCalculator, year: int, month: int, expected: int
     ):
-        """February 2024 is a leap year with 29 days, has 21 weekdays."""
-        result = working_days_calculator.calculate_weekdays(2024, 2)
-        assert result == 21
-
-    def test_april_has_22_weekdays(self, working_days_calculator: WorkingDaysCalculator):
-        """April 2025 has 30 days with 22 weekdays."""
-        result = working_days_calculator.calculate_weekdays(2025, 4)
-        assert result == 22
-
-    def test_december_2025_has_23_weekdays(self, working_days_calculator: WorkingDaysCalculator):
-        """December 2025 has 23 weekdays."""
-        result = working_days_calculator.calculate_weekdays(2025, 12)
-        assert result == 23
+        """Weekday counts for representative months (short, long, leap February)."""
+        result = working_days_calculator.calculate_weekdays(year, month)
+        assert result == expected
 
 
 class TestCalculateWithLeaves:
@@ -94,52 +86,28 @@ class TestCalculateWithLeaves:
 class TestGetServicePeriod:
     """Tests for get_service_period method."""
 
+    @pytest.mark.parametrize(
+        "reference,expected_start,expected_end",
+        [
+            (date(2025, 1, 15), date(2025, 1, 1), date(2025, 1, 31)),  # mid-month
+            (date(2025, 2, 10), date(2025, 2, 1), date(2025, 2, 28)),  # non-leap February
+            (date(2024, 2, 10), date(2024, 2, 1), date(2024, 2, 29)),  # leap February
+            (date(2025, 3, 1), date(2025, 3, 1), date(2025, 3, 31)),  # first day of month
+            (date(2025, 4, 30), date(2025, 4, 1), date(2025, 4, 30)),  # last day of month
+        ],
+    )
     def test_returns_first_and_last_day_of_month(
-        self, working_days_calculator: WorkingDaysCalculator
+        self,
+        working_days_calculator: WorkingDaysCalculator,
+        reference: date,
+        expected_start: date,
+        expected_end: date,
     ):
-        """Service period spans entire month."""
-        reference = date(2025, 1, 15)
-
-        start, end = working_days_calculator.get_service_period(reference)
-
-        assert start == date(2025, 1, 1)
-        assert end == date(2025, 1, 31)
-
-    def test_february_non_leap_year(self, working_days_calculator: WorkingDaysCalculator):
-        """February in non-leap year ends on 28th."""
-        reference = date(2025, 2, 10)
-
-        start, end = working_days_calculator.get_service_period(reference)
-
-        assert start == date(2025, 2, 1)
-        assert end == date(2025, 2, 28)
-
-    def test_february_leap_year(self, working_days_calculator: WorkingDaysCalculator):
-        """February in leap year ends on 29th."""
-        reference = date(2024, 2, 10)
-
-        start, end = working_days_calculator.get_service_period(reference)
-
-        assert start == date(2024, 2, 1)
-        assert end == date(2024, 2, 29)
-
-    def test_works_with_first_day_of_month(self, working_days_calculator: WorkingDaysCalculator):
-        """Works correctly when reference is first day of month."""
-        reference = date(2025, 3, 1)
-
-        start, end = working_days_calculator.get_service_period(reference)
-
-        assert start == date(2025, 3, 1)
-        assert end == date(2025, 3, 31)
-
-    def test_works_with_last_day_of_month(self, working_days_calculator: WorkingDaysCalculator):
-        """Works correctly when reference is last day of month."""
-        reference = date(2025, 4, 30)
-
+        """Service period spans the entire month of the reference date."""
         start, end = working_days_calculator.get_service_period(reference)
 
-        assert start == date(2025, 4, 1)
-        assert end == date(2025, 4, 30)
+        assert start == expected_start
+        assert end == expected_end
 
 
 class TestCalculateWeekdaysForRange: